@@ -35,13 +35,12 @@ def execute_metadata_loader(parameters: list) -> None:
         # Generate toolbox metadata if available
         if toolbox_config.documentation:
             arcpy.AddMessage("Generating toolbox metadata...")
-            from .metadata_generator import create_toolbox_metadata_xml
+            from .metadata_generator import write_toolbox_metadata_xml
 
-            toolbox_xml_content = create_toolbox_metadata_xml(toolbox_config)
             toolbox_xml_path = toolbox_dir / "yaml_toolbox.pyt.xml"
 
-            with open(toolbox_xml_path, "w", encoding="utf-8") as f:
-                f.write(toolbox_xml_content)
+            with open(toolbox_xml_path, "wb") as f:
+                write_toolbox_metadata_xml(f, toolbox_config)
 
             arcpy.AddMessage("  ✓ Toolbox metadata → yaml_toolbox.pyt.xml")
             arcpy.AddMessage("")
@@ -5,14 +5,27 @@ for both tool and toolbox metadata from YAML configuration files.
 """
 
 import html
+import re
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO, TextIO
+from xml.sax.saxutils import escape
 
-import yaml
+from src.framework.config import ToolConfig, load_tool_config
 
-from src.framework.config import ToolConfig
+# Whitespace around line breaks, blank-line paragraph breaks, bullet lines
+# and the line breaks inside a bullet list that are not followed by a bullet
+_LINE_EDGES = re.compile(r"[^\S\n]*\n[^\S\n]*")
+_PARAGRAPH_BREAK = re.compile(r"\n{2,}")
+_BULLET_START = re.compile(r"^- ", re.MULTILINE)
+_CONTINUATION = re.compile(r"\n(?!- )")
 
 
+# Tools repeat the same summaries and parameter descriptions, so fragments
+# are memoized across a metadata run
+@lru_cache(maxsize=2048)
 def wrap_in_html_div(text: str, preserve_newlines: bool = False) -> str:
     """Wrap text content in ArcGIS Pro HTML DIV format.
 
@@ -29,172 +42,205 @@ def wrap_in_html_div(text: str, preserve_newlines: bool = False) -> str:
         content = f"<P><SPAN>{text_escaped}</SPAN></P>"
         return f'<DIV STYLE="text-align:Left;"><DIV>{content}</DIV></DIV>'
 
-    # Parse text with paragraphs, keeping bullet points as "- " text with line breaks
-    lines = text.strip().split("\n")
+    # Strip every line, then split into paragraphs on blank lines
+    text = _LINE_EDGES.sub("\n", text.strip())
     paragraphs = []
-    current_paragraph_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-
-        if not stripped:
-            # Empty line - finish current paragraph
-            if current_paragraph_lines:
-                # Escape each line individually, then join with <BR/>
-                escaped_lines = [html.escape(line) for line in current_paragraph_lines]
-                para_text = "<BR/>".join(escaped_lines)
-                paragraphs.append(f"<P><SPAN>{para_text}</SPAN></P>")
-                current_paragraph_lines = []
-            continue
-
-        # Check if this is a continuation of a bullet point (doesn't start with "- ")
-        if (
-            current_paragraph_lines
-            and not stripped.startswith("- ")
-            and current_paragraph_lines[-1].startswith("- ")
-        ):
-            # Join continuation line to previous bullet point
-            current_paragraph_lines[-1] += " " + stripped
-        else:
-            # Add as new line (either new bullet or regular text)
-            current_paragraph_lines.append(stripped)
-
-    # Add any remaining content
-    if current_paragraph_lines:
-        # Escape each line individually, then join with <BR/>
-        escaped_lines = [html.escape(line) for line in current_paragraph_lines]
-        para_text = "<BR/>".join(escaped_lines)
+
+    for paragraph in filter(None, _PARAGRAPH_BREAK.split(text)):
+        # From the first bullet on, lines not starting with "- " continue
+        # the bullet above them; lines before it stay separate
+        bullet = _BULLET_START.search(paragraph)
+        if bullet:
+            head, tail = paragraph[: bullet.start()], paragraph[bullet.start() :]
+            paragraph = head + _CONTINUATION.sub(" ", tail)
+        para_text = html.escape(paragraph).replace("\n", "<BR/>")
         paragraphs.append(f"<P><SPAN>{para_text}</SPAN></P>")
 
     content = "".join(paragraphs)
     return f'<DIV STYLE="text-align:Left;"><DIV>{content}</DIV></DIV>'
 
 
-def create_tool_metadata_xml(tool_config: ToolConfig, tool_class_name: str) -> str:
-    """Create XML metadata for a tool from its configuration.
+# Same escaping as ElementTree's serializer for attribute values
+_ATTR_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+
+
+def _xml_attr(value: str) -> str:
+    """Escape a string for use as an XML attribute value."""
+    return escape(value, _ATTR_ENTITIES)
+
+
+def _xml_element(tag: str, text: str, children: list[str] | None = None) -> str:
+    """Serialize an attribute-less element, as ElementTree would.
 
     Args:
-        tool_config: Validated tool configuration with documentation
-        tool_class_name: Name of the tool class (e.g., "BufferAnalysisTool")
+        tag: Element name
+        text: Element text (escaped here)
+        children: Already-serialized child elements
 
     Returns:
-        Formatted XML string for the tool metadata
+        Serialized element, self-closing when it has no text or children
     """
-    if not tool_config.documentation:
-        # Return minimal XML if no documentation is provided
-        return """<?xml version="1.0"?>
-<metadata xml:lang="en"><Esri><CreaDate>20260115</CreaDate><CreaTime>16363800</CreaTime><ArcGISFormat>1.0</ArcGISFormat><SyncOnce>TRUE</SyncOnce></Esri></metadata>"""
+    if not text and not children:
+        return f"<{tag} />"
+    return f"<{tag}>{escape(text)}{''.join(children or ())}</{tag}>"
 
-    doc = tool_config.documentation
 
-    # Create root element
-    root = ET.Element("metadata")
-    root.set("xml:lang", "en")
+def _xml_html_element(tag: str, html_text: str) -> str:
+    """Serialize an element holding wrap_in_html_div output as CDATA.
 
-    # Esri metadata
-    esri = ET.SubElement(root, "Esri")
-    ET.SubElement(esri, "CreaDate").text = "20260115"
-    ET.SubElement(esri, "CreaTime").text = "16363800"
-    ET.SubElement(esri, "ArcGISFormat").text = "1.0"
-    ET.SubElement(esri, "SyncOnce").text = "TRUE"
+    The HTML is already entity-escaped, so it goes in verbatim rather than
+    being escaped a second time. It can never contain "]]>" because
+    html.escape turns every ">" into "&gt;".
+    """
+    return f"<{tag}><![CDATA[{html_text}]]></{tag}>"
 
-    # Tool metadata
-    tool = ET.SubElement(root, "tool")
-    tool.set("name", tool_class_name)
-    tool.set("displayname", tool_config.tool.label)
-    tool.set("toolboxalias", "yamlanalysistoolbox")
-    tool.set("xmlns", "")
 
-    # ArcToolbox help path (standard)
-    ET.SubElement(
-        tool, "arcToolboxHelpPath"
-    ).text = r"c:\program files\arcgis\pro\Resources\Help\gp"
+def _iter_tool_metadata_xml(tool_config: ToolConfig, tool_class_name: str) -> Iterator[str]:
+    """Yield the tool metadata XML as a sequence of serialized fragments."""
+    if not tool_config.documentation:
+        # Minimal XML if no documentation is provided
+        yield """<?xml version="1.0"?>
+<metadata xml:lang="en"><Esri><CreaDate>20260115</CreaDate><CreaTime>16363800</CreaTime><ArcGISFormat>1.0</ArcGISFormat><SyncOnce>TRUE</SyncOnce></Esri></metadata>"""
+        return
+
+    doc = tool_config.documentation
+
+    # Assemble the XML directly instead of building an ElementTree; elements
+    # are serialized as ET.tostring would (same escaping, attribute order and
+    # " />" for empty elements), except that HTML blocks are written as CDATA.
+    yield from (
+        '<?xml version="1.0"?>\n<metadata xml:lang="en">',
+        # Esri metadata
+        "<Esri><CreaDate>20260115</CreaDate><CreaTime>16363800</CreaTime>"
+        "<ArcGISFormat>1.0</ArcGISFormat><SyncOnce>TRUE</SyncOnce></Esri>",
+        # Tool metadata
+        f'<tool name="{_xml_attr(tool_class_name)}" '
+        f'displayname="{_xml_attr(tool_config.tool.label)}" '
+        'toolboxalias="yamlanalysistoolbox" xmlns="">',
+        # ArcToolbox help path (standard)
+        _xml_element("arcToolboxHelpPath", r"c:\program files\arcgis\pro\Resources\Help\gp"),
+    )
 
     # Parameters
     if doc.parameter_syntax:
-        parameters = ET.SubElement(tool, "parameters")
+        param_parts = []
 
         for param in tool_config.parameters:
-            param_elem = ET.SubElement(parameters, "param")
-            param_elem.set("name", param.name)
-            param_elem.set("displayname", param.displayName)
-            param_elem.set("type", param.parameterType)
-            param_elem.set("direction", param.direction)
-            param_elem.set("datatype", param.datatype)
-            param_elem.set("expression", param.name)
+            param_open = (
+                f'<param name="{_xml_attr(param.name)}" '
+                f'displayname="{_xml_attr(param.displayName)}" '
+                f'type="{_xml_attr(param.parameterType)}" '
+                f'direction="{_xml_attr(param.direction)}" '
+                f'datatype="{_xml_attr(param.datatype)}" '
+                f'expression="{_xml_attr(param.name)}"'
+            )
 
             if param.name in doc.parameter_syntax:
                 param_doc = doc.parameter_syntax[param.name]
-
-                # Dialog explanation with HTML formatting
-                ET.SubElement(param_elem, "dialogReference").text = wrap_in_html_div(
-                    param_doc.dialog_explanation
-                )
-
-                # Scripting explanation with HTML formatting
-                ET.SubElement(param_elem, "pythonReference").text = wrap_in_html_div(
-                    param_doc.scripting_explanation
-                )
+                param_parts += [
+                    param_open,
+                    ">",
+                    # Dialog explanation with HTML formatting
+                    _xml_html_element(
+                        "dialogReference", wrap_in_html_div(param_doc.dialog_explanation)
+                    ),
+                    # Scripting explanation with HTML formatting
+                    _xml_html_element(
+                        "pythonReference", wrap_in_html_div(param_doc.scripting_explanation)
+                    ),
+                    "</param>",
+                ]
+            else:
+                param_parts += [param_open, " />"]
+
+        yield _xml_element("parameters", "", param_parts)
 
     # Summary/Abstract with HTML formatting
-    ET.SubElement(tool, "summary").text = wrap_in_html_div(doc.summary)
+    yield _xml_html_element("summary", wrap_in_html_div(doc.summary))
 
     # Usage with HTML formatting (preserves newlines/lists)
-    ET.SubElement(tool, "usage").text = wrap_in_html_div(doc.usage, preserve_newlines=True)
+    yield _xml_html_element("usage", wrap_in_html_div(doc.usage, preserve_newlines=True))
 
     # Code samples
     if doc.code_samples:
-        script_examples = ET.SubElement(tool, "scriptExamples")
-
+        yield "<scriptExamples>"
         for sample in doc.code_samples:
-            script_example = ET.SubElement(script_examples, "scriptExample")
-            ET.SubElement(script_example, "title").text = sample.title
-            ET.SubElement(script_example, "para").text = wrap_in_html_div(sample.description)
-            ET.SubElement(script_example, "code").text = sample.code.strip()
+            yield from [
+                "<scriptExample>",
+                _xml_element("title", sample.title),
+                _xml_html_element("para", wrap_in_html_div(sample.description)),
+                _xml_element("code", sample.code.strip()),
+                "</scriptExample>",
+            ]
+        yield "</scriptExamples>"
+
+    yield "</tool>"
 
     # Data identification info with search keywords
-    data_id_info = ET.SubElement(root, "dataIdInfo")
-    id_citation = ET.SubElement(data_id_info, "idCitation")
-    ET.SubElement(id_citation, "resTitle").text = tool_config.tool.label
+    yield from [
+        "<dataIdInfo><idCitation>",
+        _xml_element("resTitle", tool_config.tool.label),
+        "</idCitation>",
+    ]
 
     if doc.tags:
-        search_keys = ET.SubElement(data_id_info, "searchKeys")
-        for tag in doc.tags:
-            ET.SubElement(search_keys, "keyword").text = tag
+        yield "<searchKeys>"
+        yield from (_xml_element("keyword", tag) for tag in doc.tags)
+        yield "</searchKeys>"
 
     # Credits
     if doc.credits:
-        ET.SubElement(data_id_info, "idCredit").text = doc.credits
+        yield _xml_element("idCredit", doc.credits)
 
     # Use limitations
     if doc.use_limitations:
-        res_consts = ET.SubElement(data_id_info, "resConst")
-        consts = ET.SubElement(res_consts, "Consts")
-        ET.SubElement(consts, "useLimit").text = wrap_in_html_div(
-            doc.use_limitations, preserve_newlines=True
-        )
+        yield from [
+            "<resConst><Consts>",
+            _xml_html_element(
+                "useLimit", wrap_in_html_div(doc.use_limitations, preserve_newlines=True)
+            ),
+            "</Consts></resConst>",
+        ]
+
+    yield from [
+        "</dataIdInfo>",
+        # Distribution info
+        "<distInfo><distributor><distorFormat><formatName>ArcToolbox Tool</formatName>"
+        "</distorFormat></distributor></distInfo>",
+        # Metadata hierarchy level
+        '<mdHrLv><ScopeCd value="005" /></mdHrLv>',
+        # Metadata date stamp
+        '<mdDateSt Sync="TRUE">20260115</mdDateSt>',
+        "</metadata>",
+    ]
 
-    # Distribution info
-    dist_info = ET.SubElement(root, "distInfo")
-    distributor = ET.SubElement(dist_info, "distributor")
-    distor_format = ET.SubElement(distributor, "distorFormat")
-    ET.SubElement(distor_format, "formatName").text = "ArcToolbox Tool"
 
-    # Metadata hierarchy level
-    md_hr_lv = ET.SubElement(root, "mdHrLv")
-    scope_cd = ET.SubElement(md_hr_lv, "ScopeCd")
-    scope_cd.set("value", "005")
+def create_tool_metadata_xml(tool_config: ToolConfig, tool_class_name: str) -> str:
+    """Create XML metadata for a tool from its configuration.
+
+    Args:
+        tool_config: Validated tool configuration with documentation
+        tool_class_name: Name of the tool class (e.g., "BufferAnalysisTool")
 
-    # Metadata date stamp
-    md_date_st = ET.SubElement(root, "mdDateSt")
-    md_date_st.set("Sync", "TRUE")
-    md_date_st.text = "20260115"
+    Returns:
+        Formatted XML string for the tool metadata
+    """
+    # Compact format without pretty printing (as ArcGIS Pro writes it)
+    return "".join(_iter_tool_metadata_xml(tool_config, tool_class_name))
 
-    # Convert to string without pretty printing (ArcGIS Pro uses compact format)
-    xml_str = ET.tostring(root, encoding="unicode")
 
-    # Add XML declaration
-    return f'<?xml version="1.0"?>\n{xml_str}'
+def write_tool_metadata_xml(file: TextIO, tool_config: ToolConfig, tool_class_name: str) -> None:
+    """Write XML metadata for a tool straight to an open text file.
+
+    Fragments go to the file's buffer as they are produced, so the whole
+    document is never held as a single string.
+
+    Args:
+        file: Text file opened for writing
+        tool_config: Validated tool configuration with documentation
+        tool_class_name: Name of the tool class (e.g., "BufferAnalysisTool")
+    """
+    file.writelines(_iter_tool_metadata_xml(tool_config, tool_class_name))
 
 
 def generate_metadata_for_tool(
@@ -207,14 +253,9 @@ def generate_metadata_for_tool(
         output_dir: Directory where .pyt.xml file will be written
         tool_class_name: Name of the tool class for the XML filename
     """
-    # Load tool configuration
-    with open(tool_config_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-
-    tool_config = ToolConfig(**data)
-
-    # Generate XML
-    xml_content = create_tool_metadata_xml(tool_config, tool_class_name)
+    # Load tool configuration through the framework loader (libyaml when
+    # available, memoized per file so tools already loaded are not reparsed)
+    tool_config = load_tool_config(tool_config_path)
 
     # Write XML file
     # Format: yaml_toolbox.{ToolClassName}.pyt.xml
@@ -222,24 +263,22 @@ def generate_metadata_for_tool(
     xml_path = output_dir / xml_filename
 
     with open(xml_path, "w", encoding="utf-8") as f:
-        f.write(xml_content)
+        write_tool_metadata_xml(f, tool_config, tool_class_name)
 
 
-def create_toolbox_metadata_xml(toolbox_config) -> str:
-    """Create XML metadata for the toolbox from its configuration.
+# Minimal toolbox XML used when no documentation is provided
+_MINIMAL_TOOLBOX_XML = """<?xml version="1.0"?>
+<metadata xml:lang="en"><Esri><CreaDate>20260115</CreaDate><CreaTime>16183200</CreaTime><ArcGISFormat>1.0</ArcGISFormat><SyncOnce>TRUE</SyncOnce></Esri></metadata>"""
 
-    Args:
-        toolbox_config: Validated toolbox configuration
+_XML_DECLARATION = '<?xml version="1.0"?>\n'
 
-    Returns:
-        Formatted XML string for the toolbox metadata
-    """
+
+def _build_toolbox_metadata_tree(toolbox_config) -> ET.Element | None:
+    """Build the toolbox metadata element tree (None without documentation)."""
     doc = toolbox_config.documentation
 
     if not doc:
-        # Return minimal XML if no documentation is provided
-        return """<?xml version="1.0"?>
-<metadata xml:lang="en"><Esri><CreaDate>20260115</CreaDate><CreaTime>16183200</CreaTime><ArcGISFormat>1.0</ArcGISFormat><SyncOnce>TRUE</SyncOnce></Esri></metadata>"""
+        return None
 
     # Create root element
     root = ET.Element("metadata")
@@ -306,8 +345,39 @@ def create_toolbox_metadata_xml(toolbox_config) -> str:
     md_date_st.set("Sync", "TRUE")
     md_date_st.text = "20260115"
 
-    # Convert to string
-    xml_str = ET.tostring(root, encoding="unicode")
+    return root
+
+
+def create_toolbox_metadata_xml(toolbox_config) -> str:
+    """Create XML metadata for the toolbox from its configuration.
+
+    Args:
+        toolbox_config: Validated toolbox configuration
+
+    Returns:
+        Formatted XML string for the toolbox metadata
+    """
+    root = _build_toolbox_metadata_tree(toolbox_config)
+    if root is None:
+        return _MINIMAL_TOOLBOX_XML
+
+    return _XML_DECLARATION + ET.tostring(root, encoding="unicode")
+
+
+def write_toolbox_metadata_xml(file: BinaryIO, toolbox_config) -> None:
+    """Write XML metadata for the toolbox to a file opened in binary mode.
+
+    ElementTree serializes straight to UTF-8 bytes, so the document is never
+    held as a str and then encoded again on write.
+
+    Args:
+        file: Binary file opened for writing
+        toolbox_config: Validated toolbox configuration
+    """
+    root = _build_toolbox_metadata_tree(toolbox_config)
+    if root is None:
+        file.write(_MINIMAL_TOOLBOX_XML.encode("utf-8"))
+        return
 
-    # Add XML declaration
-    return f'<?xml version="1.0"?>\n{xml_str}'
+    file.write(_XML_DECLARATION.encode("utf-8"))
+    ET.ElementTree(root).write(file, encoding="utf-8", xml_declaration=False)
@@ -0,0 +1,126 @@
+"""Test metadata XML generation."""
+
+import io
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from src.framework import config
+from src.framework.config import ToolConfig, load_tool_config, load_toolbox_config
+
+from .metadata_generator import (
+    create_tool_metadata_xml,
+    create_toolbox_metadata_xml,
+    generate_metadata_for_tool,
+    wrap_in_html_div,
+    write_toolbox_metadata_xml,
+)
+
+TOOLS_DIR = Path(__file__).parent.parent
+TOOLBOX_DIR = TOOLS_DIR.parent / "toolboxes" / "spatial_analysis"
+
+
+@pytest.mark.parametrize(
+    ("tool_path", "tool_class_name"),
+    [
+        ("spatial_analysis/buffer_analysis", "BufferAnalysisTool"),
+        ("spatial_analysis/clip_features", "ClipFeaturesTool"),
+    ],
+)
+def test_tool_metadata_matches_committed_xml(tool_path, tool_class_name):
+    """Test generated tool metadata matches the committed .pyt.xml byte for byte."""
+    tool_config = load_tool_config(TOOLS_DIR / tool_path / "tool.yml")
+    expected = (TOOLBOX_DIR / f"yaml_toolbox.{tool_class_name}.pyt.xml").read_text(encoding="utf-8")
+
+    assert create_tool_metadata_xml(tool_config, tool_class_name) == expected
+
+
+def test_generate_metadata_for_tool_streams_to_file(tmp_path):
+    """Test the streamed file matches the in-memory XML."""
+    tool_path = TOOLS_DIR / "spatial_analysis" / "buffer_analysis" / "tool.yml"
+
+    generate_metadata_for_tool(tool_path, tmp_path, "BufferAnalysisTool")
+
+    written = (tmp_path / "yaml_toolbox.BufferAnalysisTool.pyt.xml").read_text(encoding="utf-8")
+    assert written == create_tool_metadata_xml(load_tool_config(tool_path), "BufferAnalysisTool")
+
+
+def test_generate_metadata_reuses_loaded_config(tmp_path, monkeypatch):
+    """Test configs already loaded by the framework are not parsed again."""
+    tool_path = TOOLS_DIR / "spatial_analysis" / "clip_features" / "tool.yml"
+    load_tool_config(tool_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("tool.yml should not be parsed again")
+
+    monkeypatch.setattr(config, "load_yaml", fail)
+    generate_metadata_for_tool(tool_path, tmp_path, "ClipFeaturesTool")
+
+    assert (tmp_path / "yaml_toolbox.ClipFeaturesTool.pyt.xml").exists()
+
+
+def test_tool_metadata_escaping():
+    """Test text and attribute values are escaped and HTML is wrapped in CDATA."""
+    tool_config = ToolConfig(
+        tool={"name": "demo", "label": 'Say "hi" & <bye>\n', "description": "Demo"},
+        implementation={"executeFunction": "demo.execute"},
+        parameters=[],
+        documentation={"summary": "A & B", "usage": "Usage", "tags": ["x<y"]},
+    )
+
+    xml = create_tool_metadata_xml(tool_config, "DemoTool")
+
+    assert 'displayname="Say &quot;hi&quot; &amp; &lt;bye&gt;&#10;"' in xml
+    assert '<resTitle>Say "hi" &amp; &lt;bye&gt;\n</resTitle>' in xml
+    assert "<keyword>x&lt;y</keyword>" in xml
+    # Already-escaped HTML is embedded as CDATA rather than escaped again
+    assert "<summary><![CDATA[" in xml
+    assert "<P><SPAN>A &amp; B</SPAN></P>" in xml
+    assert ET.fromstring(xml).find("tool/summary").text.startswith("<DIV")
+
+
+def test_wrap_in_html_div_paragraphs_and_bullets():
+    """Test blank lines split paragraphs and wrapped bullet lines are rejoined."""
+    text = """
+    Intro line
+    second line
+
+    - first bullet
+      wrapped <here>
+    - second bullet
+
+
+    Outro & end
+    """
+
+    assert wrap_in_html_div(text, preserve_newlines=True) == (
+        '<DIV STYLE="text-align:Left;"><DIV>'
+        "<P><SPAN>Intro line<BR/>second line</SPAN></P>"
+        "<P><SPAN>- first bullet wrapped &lt;here&gt;<BR/>- second bullet</SPAN></P>"
+        "<P><SPAN>Outro &amp; end</SPAN></P>"
+        "</DIV></DIV>"
+    )
+    assert wrap_in_html_div("  ", preserve_newlines=True) == (
+        '<DIV STYLE="text-align:Left;"><DIV></DIV></DIV>'
+    )
+
+
+def test_wrap_in_html_div_memoized():
+    """Test repeated fragments are served from the cache."""
+    wrap_in_html_div.cache_clear()
+    first = wrap_in_html_div("Shared summary")
+
+    assert wrap_in_html_div("Shared summary") is first
+    assert wrap_in_html_div.cache_info().hits == 1
+
+
+def test_write_toolbox_metadata_xml_matches_string():
+    """Test the UTF-8 toolbox writer produces the encoded string output."""
+    toolbox_config = load_toolbox_config(TOOLBOX_DIR)
+    buffer = io.BytesIO()
+
+    write_toolbox_metadata_xml(buffer, toolbox_config)
+
+    assert buffer.getvalue() == create_toolbox_metadata_xml(toolbox_config).encode("utf-8")
+    assert buffer.getvalue().startswith(b'<?xml version="1.0"?>\n<metadata xml:lang="en">')
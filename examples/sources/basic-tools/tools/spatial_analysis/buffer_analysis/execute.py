@@ -18,15 +18,12 @@ def execute_buffer(parameters, messages, config: ToolConfig):
         config: Tool configuration loaded from YAML
     """
     try:
-        # Build parameter index map from config
-        param_map = {p.name: p.index for p in config.parameters}
-
         # Extract parameters using index from YAML
-        input_features = parameters[param_map["input_features"]].valueAsText
-        buffer_distance = parameters[param_map["buffer_distance"]].value
-        buffer_units = parameters[param_map["buffer_units"]].valueAsText
-        dissolve = parameters[param_map["dissolve_output"]].value
-        output_features = parameters[param_map["output_features"]].valueAsText
+        input_features = parameters[config.idx("input_features")].valueAsText
+        buffer_distance = parameters[config.idx("buffer_distance")].value
+        buffer_units = parameters[config.idx("buffer_units")].valueAsText
+        dissolve = parameters[config.idx("dissolve_output")].value
+        output_features = parameters[config.idx("output_features")].valueAsText
 
         # Validate parameters against YAML rules
         validate_all_parameters(parameters, config, messages)
@@ -11,6 +11,7 @@ from src.framework.config import (
     ToolMetadata,
 )
 
+from . import execute as clip_execute
 from .execute import execute_clip
 
 
@@ -73,10 +74,10 @@ def test_clip_execution(mock_clip_config, mock_parameters):
     """Test clip execution with mocked ArcPy."""
     messages = Mock()
 
-    with patch("toolbox.tools.spatial_analysis.clip_features.execute.arcpy") as mock_arcpy:
-        # Mock GetCount results
-        mock_arcpy.management.GetCount.side_effect = [["100"], ["50"]]
-
+    with (
+        patch.object(clip_execute, "arcpy") as mock_arcpy,
+        patch.object(clip_execute, "get_feature_count", return_value=50),
+    ):
         # Execute
         execute_clip(mock_parameters, messages, mock_clip_config)
 
@@ -84,4 +85,33 @@ def test_clip_execution(mock_clip_config, mock_parameters):
         mock_arcpy.analysis.Clip.assert_called_once()
 
         # Verify messages
-        assert messages.addMessage.called
+        messages.addMessage.assert_any_call("✓ Created 50 clipped features")
+
+
+def test_clip_counts_output_only_by_default(mock_clip_config, mock_parameters):
+    """Test only the output is counted unless report_input_count is enabled."""
+    messages = Mock()
+
+    with (
+        patch.object(clip_execute, "arcpy"),
+        patch.object(clip_execute, "get_feature_count", return_value=50) as mock_count,
+    ):
+        execute_clip(mock_parameters, messages, mock_clip_config)
+
+    mock_count.assert_called_once_with("output.shp")
+
+
+def test_clip_reports_input_count_when_enabled(mock_clip_config, mock_parameters):
+    """Test report_input_count counts the input before clipping."""
+    mock_clip_config.implementation.options["report_input_count"] = True
+    messages = Mock()
+
+    with (
+        patch.object(clip_execute, "arcpy"),
+        patch.object(clip_execute, "get_feature_count", side_effect=[100, 50]) as mock_count,
+    ):
+        execute_clip(mock_parameters, messages, mock_clip_config)
+
+    assert [c.args for c in mock_count.call_args_list] == [("input.shp",), ("output.shp",)]
+    messages.addMessage.assert_any_call("Input features: 100")
+    messages.addMessage.assert_any_call("✓ Created 50 clipped features")
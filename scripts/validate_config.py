@@ -1,18 +1,36 @@
 """Validate all YAML configurations."""
 
+import logging
 from pathlib import Path
 
-from src.framework.config import load_tool_config, load_toolbox_config
+from src.framework.config import ToolboxConfig, load_tool_config, load_toolbox_config
 
+logger = logging.getLogger(__name__)
+
+
+def validate_all_configs(toolbox_configs: dict[str, ToolboxConfig] | None = None):
+    """
+    Validate all toolbox and tool configurations.
+
+    Progress and errors are reported only through this module's logger
+    (INFO and ERROR). Running the script configures stdout output; other
+    callers must configure logging themselves (e.g. logging.basicConfig)
+    to see the report, otherwise only the return value is available.
+
+    Args:
+        toolbox_configs: Already-loaded toolbox configurations keyed by
+            toolbox directory name; matching toolboxes skip reading toolbox.yml
+
+    Returns:
+        True if every configuration is valid
+    """
+    toolbox_configs = toolbox_configs or {}
 
-def validate_all_configs():
-    """Validate all toolbox and tool configurations."""
     # Get src directory
     src_dir = Path(__file__).parent.parent / "src"
     toolboxes_dir = src_dir / "toolboxes"
 
-    print("Validating toolbox configurations...")
-    print("=" * 60)
+    logger.info("Validating toolbox configurations...\n%s", "=" * 60)
 
     all_valid = True
 
@@ -20,18 +38,23 @@ def validate_all_configs():
     toolboxes = [d for d in toolboxes_dir.iterdir() if d.is_dir() and (d / "toolbox.yml").exists()]
 
     if not toolboxes:
-        print("✗ No toolboxes found!")
+        logger.error("✗ No toolboxes found!")
         return False
 
     for toolbox_dir in toolboxes:
-        print(f"\nToolbox: {toolbox_dir.name}")
-        print("-" * 60)
+        logger.info("\nToolbox: %s\n%s", toolbox_dir.name, "-" * 60)
 
         try:
-            toolbox_config = load_toolbox_config(toolbox_dir)
-            print(f"✓ {toolbox_config.toolbox.label} ({toolbox_config.toolbox.alias})")
-            print(f"  Version: {toolbox_config.toolbox.version}")
-            print(f"  Tools: {len(toolbox_config.tools)} registered")
+            toolbox_config = toolbox_configs.get(toolbox_dir.name)
+            if toolbox_config is None:
+                toolbox_config = load_toolbox_config(toolbox_dir)
+            logger.info(
+                "✓ %s (%s)\n  Version: %s\n  Tools: %d registered",
+                toolbox_config.toolbox.label,
+                toolbox_config.toolbox.alias,
+                toolbox_config.toolbox.version,
+                len(toolbox_config.tools),
+            )
 
             # Validate each tool referenced in this toolbox
             for tool_ref in toolbox_config.tools:
@@ -42,22 +65,26 @@ def validate_all_configs():
                     tool_config = load_tool_config(tool_config_path)
                     status = "✓" if tool_ref.enabled else "○"
                     enabled_text = "enabled" if tool_ref.enabled else "disabled"
-                    print(f"    {status} {tool_ref.name} ({enabled_text})")
-                    print(f"       Label: {tool_config.tool.label}")
-                    print(f"       Parameters: {len(tool_config.parameters)}")
+                    logger.info(
+                        "    %s %s (%s)\n       Label: %s\n       Parameters: %d",
+                        status,
+                        tool_ref.name,
+                        enabled_text,
+                        tool_config.tool.label,
+                        len(tool_config.parameters),
+                    )
                 except Exception as e:
-                    print(f"    ✗ {tool_ref.name}: {e}")
+                    logger.error("    ✗ %s: %s", tool_ref.name, e)
                     all_valid = False
 
         except Exception as e:
-            print(f"✗ Toolbox validation failed: {e}")
+            logger.error("✗ Toolbox validation failed: %s", e)
             all_valid = False
 
-    print("\n" + "=" * 60)
     if all_valid:
-        print("✓ All configurations valid!")
+        logger.info("\n%s\n✓ All configurations valid!", "=" * 60)
     else:
-        print("✗ Some configurations have errors")
+        logger.error("\n%s\n✗ Some configurations have errors", "=" * 60)
 
     return all_valid
 
@@ -65,5 +92,6 @@ def validate_all_configs():
 if __name__ == "__main__":
     import sys
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     success = validate_all_configs()
     sys.exit(0 if success else 1)
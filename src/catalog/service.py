@@ -50,15 +50,22 @@ class CatalogService:
 
     DEFAULT_VERSION = "1.0"
 
-    def __init__(self, catalog_path: Path | None = None, workspace_path: Path | None = None):
+    def __init__(
+        self,
+        catalog_path: Path | None = None,
+        workspace_path: Path | None = None,
+        backup: bool = True,
+    ):
         """
         Initialize catalog service.
 
         Args:
             catalog_path: Path to catalog.yml. If None, uses workspace default
             workspace_path: Path to workspace directory. If None, uses default
+            backup: Whether saves may back up the existing file (default: True)
         """
         self.workspace_service = WorkspaceService()
+        self.backup = backup
 
         # Initialize workspace
         if workspace_path:
@@ -108,13 +115,17 @@ class CatalogService:
         except yaml.YAMLError as e:
             raise CatalogValidationError(f"Invalid YAML: {e}") from e
 
-    def save(self, catalog: Catalog | None = None, backup: bool = True) -> None:
+    def save(self, catalog: Catalog | None = None, backup: bool = True) -> Path | None:
         """
         Save catalog to file.
 
         Args:
             catalog: Catalog to save. If None, saves current loaded catalog
-            backup: Whether to create backup before saving (default: True)
+            backup: Whether to create backup before saving (default: True).
+                Ignored when the service was created with backup=False
+
+        Returns:
+            Path | None: Path to the backup file, or None if no backup was made
 
         Raises:
             CatalogError: If no catalog to save
@@ -133,8 +144,9 @@ class CatalogService:
             catalog.settings.workspace_path = self.workspace_path
 
         # Create backup if file exists
-        if backup and self.catalog_path.exists():
-            self._create_backup()
+        backup_path = None
+        if backup and self.backup and self.catalog_path.exists():
+            backup_path = self._create_backup()
 
         # Ensure parent directory exists
         self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
@@ -156,6 +168,7 @@ class CatalogService:
             )
 
         self._catalog = catalog
+        return backup_path
 
     def create_new(
         self, settings: CatalogSettings | None = None, overwrite: bool = False
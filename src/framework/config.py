@@ -1,9 +1,21 @@
 """Pydantic schemas for YAML configuration validation."""
 
+import re
+from collections.abc import Callable
+from functools import cached_property
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+
+from src.framework.yaml_loader import load_yaml
+
+try:
+    # Linear-time regex engine (optional "re2" extra); immune to catastrophic
+    # backtracking on user-supplied values
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
 
 
 class ToolboxMetadata(BaseModel):
@@ -80,6 +92,11 @@ class ToolboxConfig(BaseModel):
             raise ValueError(f"Duplicate tool names found: {set(duplicates)}")
         return v
 
+    @cached_property
+    def enabled_tools(self) -> tuple[ToolReference, ...]:
+        """Tool references with enabled set, in registry order."""
+        return tuple(tool_ref for tool_ref in self.tools if tool_ref.enabled)
+
 
 class FilterConfig(BaseModel):
     """Parameter filter configuration."""
@@ -108,6 +125,16 @@ class ParameterConfig(BaseModel):
         default=None, description="Runtime validation checks for this parameter"
     )
 
+    # Composed runtime validator, built on first use by src.framework.validators
+    _validator: Callable[[Any], None] | None = PrivateAttr(default=None)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Validator closures are rebuilt on demand and don't pickle
+        state = super().__getstate__()
+        if state["__pydantic_private__"]:
+            state["__pydantic_private__"] = {**state["__pydantic_private__"], "_validator": None}
+        return state
+
 
 class ValidationCheck(BaseModel):
     """Individual validation check."""
@@ -120,11 +147,42 @@ class ValidationCheck(BaseModel):
     pattern: str | None = None  # For regex
     message: str | None = None
 
+    @cached_property
+    def compiled_pattern(self) -> re.Pattern | None:
+        """
+        Regex pattern compiled once per check (None if no pattern).
+
+        Uses re2 when installed, falling back to re for patterns RE2 can't
+        express (backreferences, lookarounds).
+        """
+        if not self.pattern:
+            return None
+        if re2 is not None:
+            try:
+                return re2.compile(self.pattern)
+            except re2.error:
+                pass
+        return re.compile(self.pattern)
+
+    @cached_property
+    def value_set(self) -> frozenset:
+        """Allowed one_of values as a set for constant-time membership tests."""
+        return frozenset(self.values or ())
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Compiled patterns are rebuilt on demand; re2 objects don't pickle
+        state = super().__getstate__()
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k != "compiled_pattern"}
+        return state
+
 
 class ImplementationConfig(BaseModel):
     """Tool implementation details."""
 
     executeFunction: str = Field(..., description="Fully qualified execute function path")
+    options: dict[str, Any] = Field(
+        default_factory=dict, description="Tool-specific settings read by the execute function"
+    )
 
 
 class ParameterSyntax(BaseModel):
@@ -177,6 +235,68 @@ class ToolConfig(BaseModel):
         default=None, description="Optional documentation metadata for ArcGIS Pro"
     )
 
+    @cached_property
+    def parameters_by_name(self) -> dict[str, ParameterConfig]:
+        """Parameter configs keyed by parameter name, computed once per config."""
+        return {p.name: p for p in self.parameters}
+
+    @cached_property
+    def param_index(self) -> dict[str, int]:
+        """Parameter indices keyed by parameter name, computed once per config."""
+        return {p.name: p.index for p in self.parameters}
+
+    def idx(self, name: str) -> int:
+        """Return the index of the named parameter in the tool's parameter list."""
+        return self.param_index[name]
+
+    @cached_property
+    def validated_parameters(self) -> tuple[ParameterConfig, ...]:
+        """Parameter configs that have validation rules, computed once per config."""
+        return tuple(p for p in self.parameters if p.validation)
+
+    @cached_property
+    def parameters_by_index(self) -> tuple[ParameterConfig, ...]:
+        """Parameter configs sorted by index, computed once per config."""
+        return tuple(sorted(self.parameters, key=lambda p: p.index))
+
+    @cached_property
+    def parameter_recipes(self) -> tuple[tuple, ...]:
+        """
+        Flattened arcpy.Parameter settings, ordered by parameter index.
+
+        Each recipe is (name, displayName, datatype, parameterType, direction,
+        defaultValue, filter, columns), where filter is None or a
+        (filter_type, filter_list) pair and filter_type is None when the
+        filter type should be left unset (File filters).
+
+        Returns:
+            Tuple of recipes, computed once per config
+        """
+        recipes = []
+        for param in self.parameters_by_index:
+            param_filter = None
+            if param.filter:
+                if param.filter.type == "Range":
+                    param_filter = ("Range", [param.filter.min, param.filter.max])
+                elif param.filter.type == "ValueList":
+                    param_filter = ("ValueList", param.filter.values)
+                elif param.filter.type == "File":
+                    param_filter = (None, param.filter.fileFilters)
+
+            recipes.append(
+                (
+                    param.name,
+                    param.displayName,
+                    param.datatype,
+                    param.parameterType,
+                    param.direction,
+                    param.defaultValue,
+                    param_filter,
+                    param.columns,
+                )
+            )
+        return tuple(recipes)
+
     @model_validator(mode="after")
     def validate_parameter_indices(self) -> "ToolConfig":
         """Ensure parameter indices are unique, start at 0, and have no gaps."""
@@ -209,18 +329,57 @@ class ToolConfig(BaseModel):
         return self
 
 
+# Validated configs keyed by resolved path -> ((st_mtime_ns, st_size), config).
+# Configs are shared between callers and must be treated as read-only.
+_TOOLBOX_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], ToolboxConfig]] = {}
+_TOOL_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], ToolConfig]] = {}
+
+
+def _cache_key(path: Path) -> tuple[Path, tuple[int, int]]:
+    """Return the resolved path and file signature used to memoize a config."""
+    resolved = path.resolve()
+    stat = resolved.stat()
+    return resolved, (stat.st_mtime_ns, stat.st_size)
+
+
+def clear_config_cache() -> None:
+    """Forget all memoized tool and toolbox configurations."""
+    _TOOLBOX_CONFIG_CACHE.clear()
+    _TOOL_CONFIG_CACHE.clear()
+
+
+def prime_tool_config_cache(config_path: Path, config: ToolConfig) -> None:
+    """Memoize an already-validated tool config for its current file contents.
+
+    Used for trusted configs (e.g. unpickled from the factory's disk cache) so
+    later load_tool_config calls return them without re-parsing or
+    re-validating the YAML.
+    """
+    resolved, signature = _cache_key(config_path)
+    _TOOL_CONFIG_CACHE[resolved] = (signature, config)
+
+
 def load_toolbox_config(config_dir: Path) -> ToolboxConfig:
-    """Load and validate toolbox configuration."""
-    import yaml
+    """Load and validate toolbox configuration.
 
+    Parsed configs are memoized until toolbox.yml changes on disk.
+    """
     toolbox_path = config_dir / "toolbox.yml"
-    with open(toolbox_path) as f:
-        data = yaml.safe_load(f)
+    resolved, signature = _cache_key(toolbox_path)
+    cached = _TOOLBOX_CONFIG_CACHE.get(resolved)
 
-    config = ToolboxConfig(**data)
+    if cached and cached[0] == signature:
+        config = cached[1]
+    else:
+        with open(toolbox_path, "rb") as f:
+            data = load_yaml(f)
 
-    # Validate that all referenced tool configs exist
-    for tool_ref in config.tools:
+        config = ToolboxConfig(**data)
+        _TOOLBOX_CONFIG_CACHE[resolved] = (signature, config)
+
+    # Validate that all enabled tool configs exist (disabled tools are never
+    # loaded, so their configs may be missing)
+    for tool_ref in config.enabled_tools:
         tool_config_path = config_dir / tool_ref.config
         if not tool_config_path.exists():
             raise FileNotFoundError(
@@ -231,11 +390,18 @@ def load_toolbox_config(config_dir: Path) -> ToolboxConfig:
 
 
 def load_tool_config(config_path: Path) -> ToolConfig:
-    """Load and validate individual tool configuration."""
-    import yaml
+    """Load and validate individual tool configuration.
+
+    Parsed configs are memoized until the YAML file changes on disk. The file
+    is handed to the YAML parser as bytes (UTF-8, or UTF-16 with a BOM).
+    """
+    resolved, signature = _cache_key(config_path)
+    cached = _TOOL_CONFIG_CACHE.get(resolved)
+    if cached and cached[0] == signature:
+        return cached[1]
 
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
+    with open(config_path, "rb") as f:
+        data = load_yaml(f)
 
     config = ToolConfig(**data)
 
@@ -253,4 +419,5 @@ def load_tool_config(config_path: Path) -> ToolConfig:
             f"Tool name '{config.tool.name}' doesn't match expected '{expected_name}' (from path: {config_path})"
         )
 
+    _TOOL_CONFIG_CACHE[resolved] = (signature, config)
     return config
@@ -0,0 +1,89 @@
+"""Filesystem index of the toolboxes and tools in a source tree."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+# Toolsets nest tools one level down (tools/<toolset>/<tool>/tool.yml); the
+# limit guards against walking arbitrarily deep trees.
+MAX_TOOL_DEPTH = 2
+
+
+class DiscoveryIndex:
+    """Toolbox and tool directories found under a source root."""
+
+    def __init__(
+        self,
+        toolboxes: tuple[Path, ...],
+        tools: tuple[tuple[Path, str], ...],
+    ):
+        self.toolboxes = toolboxes
+        self.tools = tools
+        self.tool_by_name = {name: path for path, name in tools}
+
+    def __repr__(self) -> str:
+        return f"DiscoveryIndex(toolboxes={len(self.toolboxes)}, tools={len(self.tools)})"
+
+
+def _find_tools(tools_dir: Path) -> list[tuple[Path, str]]:
+    """
+    Collect (tool_dir, tool_name) pairs for directories containing a tool.yml.
+
+    Walks with os.scandir so entry types come from the directory listing
+    instead of a stat() per candidate path. Directories starting with "_"
+    are skipped and tool directories are not descended into.
+    """
+    tools = []
+    stack = [(os.fspath(tools_dir), 0)]
+
+    while stack:
+        directory, depth = stack.pop()
+        with os.scandir(directory) as entries:
+            subdirs = []
+            has_tool_yml = False
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.name.startswith("_"):
+                        subdirs.append(entry.path)
+                elif entry.name == "tool.yml":
+                    has_tool_yml = True
+
+        if depth and has_tool_yml:
+            tools.append((Path(directory), os.path.basename(directory)))
+        elif depth <= MAX_TOOL_DEPTH:
+            # Not a tool - may be a toolset containing tools
+            stack.extend((subdir, depth + 1) for subdir in subdirs)
+
+    tools.sort()
+    return tools
+
+
+@lru_cache(maxsize=8)
+def discover_all(source_root: Path) -> DiscoveryIndex:
+    """
+    Index the toolboxes/ and tools/ directories of a source tree.
+
+    The tree is walked once per process; call ``discover_all.cache_clear()``
+    to pick up tools added afterwards.
+
+    Args:
+        source_root: Source directory containing toolboxes/ and/or tools/
+
+    Returns:
+        DiscoveryIndex of toolbox directories (containing toolbox.yml) and
+        tool directories (containing tool.yml)
+    """
+    toolboxes_dir = source_root / "toolboxes"
+    toolboxes = []
+    if toolboxes_dir.is_dir():
+        with os.scandir(toolboxes_dir) as entries:
+            toolboxes = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "toolbox.yml"))
+            )
+
+    tools_dir = source_root / "tools"
+    tools = _find_tools(tools_dir) if tools_dir.is_dir() else []
+
+    return DiscoveryIndex(tuple(toolboxes), tuple(tools))
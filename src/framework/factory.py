@@ -1,11 +1,71 @@
 """Dynamic tool class factory."""
 
+import hashlib
 import importlib
+import json
+import logging
+import os
+import pickle
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 
-from src.framework.config import load_tool_config, load_toolbox_config
+import pydantic
+
+from src.framework.config import (
+    ToolboxConfig,
+    ToolConfig,
+    ToolReference,
+    load_tool_config,
+    load_toolbox_config,
+    prime_tool_config_cache,
+)
 from src.framework.yaml_tool import YAMLTool
 
+# Registration progress is logged at INFO; the host (e.g. the .pyt) decides
+# where it goes and at what level
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Parsed configs are pickled next to toolbox.yml so later startups can skip
+# YAML parsing and validation while none of the source files have changed.
+CONFIG_CACHE_FILENAME = ".tool_cache.pkl"
+
+# Resolved execute functions keyed by their dotted "module.function" path
+_FUNC_CACHE: dict[str, Callable] = {}
+
+
+class _GenericYAMLTool(YAMLTool):
+    """
+    YAML tool whose tool name, execute function and config path live on the class.
+
+    create_tool_class derives one thin subclass per tool that only sets
+    ``_bound``; every tool shares this __init__ and execute.
+    """
+
+    __slots__ = ("_execute_func", "_config_path")
+
+    _bound: tuple[str, Callable, Path]
+
+    def __init__(self):
+        tool_name, execute_func, config_path = self._bound
+        super().__init__(tool_name, config_path)
+        # Store for debugging
+        self._execute_func = execute_func
+        self._config_path = config_path
+
+    def execute(self, parameters, messages):
+        """Execute tool - delegates to configured execute function."""
+        try:
+            # Call the actual execute function with context
+            self._execute_func(parameters, messages, self.config)
+        except Exception as e:
+            # Add context to errors for easier debugging
+            messages.addErrorMessage(
+                f"Error in {self.label} (config: {self._config_path.name}): {e}"
+            )
+            raise
+
 
 def create_tool_class(tool_name: str, config_path: Path, execute_func):
     """
@@ -24,42 +84,151 @@ def create_tool_class(tool_name: str, config_path: Path, execute_func):
     Returns:
         Dynamically created tool class
     """
+    class_name = f"{tool_name.title().replace('_', '')}Tool"
+    return type(
+        class_name,
+        (_GenericYAMLTool,),
+        {
+            "__slots__": (),
+            "_bound": (tool_name, execute_func, config_path),
+            "__qualname__": class_name,
+            "__module__": __name__,
+            "__doc__": (
+                f"Auto-generated from: {config_path.name}\n"
+                f"Execute function: {execute_func.__module__}.{execute_func.__name__}\n"
+                f"Tool name: {tool_name}"
+            ),
+        },
+    )
+
+
+@cache
+def _config_cache_version() -> tuple[int, str, str]:
+    """
+    Return the version stamp stored with the disk cache.
 
-    # Create a proper class using class statement for correct closure
-    class DynamicTool(YAMLTool):
-        """Dynamically generated tool class."""
+    Includes a hash of the config models' JSON schemas, so pickles written
+    before a framework upgrade that changes the models are never unpickled
+    into the new classes (they would lack the new fields).
+    """
+    schemas = [ToolboxConfig.model_json_schema(), ToolConfig.model_json_schema()]
+    schema_hash = hashlib.sha256(json.dumps(schemas, sort_keys=True).encode()).hexdigest()
+    return 1, pydantic.VERSION, schema_hash
 
-        def __init__(self):
-            super().__init__(tool_name)
-            # Store for debugging
-            self._execute_func = execute_func
-            self._config_path = config_path
 
-        def execute(self, parameters, messages):
-            """Execute tool - delegates to configured execute function."""
-            try:
-                # Call the actual execute function with context
-                execute_func(parameters, messages, self.config)
-            except Exception as e:
-                # Add context to errors for easier debugging
-                messages.addErrorMessage(f"Error in {self.label} (config: {config_path.name}): {e}")
-                raise
+def _file_signature(path: Path) -> tuple[int, int]:
+    """Return the (st_mtime_ns, st_size) pair used to detect file changes."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
 
-    # Set class name and metadata
-    class_name = f"{tool_name.title().replace('_', '')}Tool"
-    DynamicTool.__name__ = class_name
-    DynamicTool.__qualname__ = class_name
-    DynamicTool.__module__ = "src.framework.factory"
-    DynamicTool.__doc__ = (
-        f"Auto-generated from: {config_path.name}\n"
-        f"Execute function: {execute_func.__module__}.{execute_func.__name__}\n"
-        f"Tool name: {tool_name}"
-    )
 
-    return DynamicTool
+def _read_config_cache(config_dir: Path) -> tuple[ToolboxConfig, dict[str, ToolConfig]] | None:
+    """
+    Load cached configs for a toolbox if none of their source files changed.
+
+    Args:
+        config_dir: Path to the config directory containing toolbox.yml
+
+    Returns:
+        Tuple of (toolbox_config, tool configs by tool name), or None on a miss
+    """
+    try:
+        with open(config_dir / CONFIG_CACHE_FILENAME, "rb") as f:
+            cached = pickle.load(f)
+
+        if cached["version"] != _config_cache_version():
+            return None
+
+        for path, signature in cached["signatures"].items():
+            if _file_signature(Path(path)) != signature:
+                return None
 
+        return cached["toolbox_config"], cached["tool_configs"]
+    except Exception:
+        # Missing, stale or unreadable cache - fall back to parsing YAML
+        return None
 
-def load_and_register_tools(config_dir: Path):
+
+def _write_config_cache(
+    config_dir: Path, toolbox_config: ToolboxConfig, tool_configs: dict[str, ToolConfig]
+) -> None:
+    """
+    Pickle parsed configs next to toolbox.yml (best effort).
+
+    Args:
+        config_dir: Path to the config directory containing toolbox.yml
+        toolbox_config: Validated toolbox configuration
+        tool_configs: Validated tool configurations keyed by tool name
+    """
+    source_paths = [config_dir / "toolbox.yml"]
+    source_paths += [config_dir / tool_ref.config for tool_ref in toolbox_config.enabled_tools]
+
+    cache_path = config_dir / CONFIG_CACHE_FILENAME
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+
+    try:
+        cached = {
+            "version": _config_cache_version(),
+            "signatures": {str(path): _file_signature(path) for path in source_paths},
+            "toolbox_config": toolbox_config,
+            "tool_configs": tool_configs,
+        }
+        with open(temp_path, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        # Read-only install or unpicklable config - caching is optional
+        temp_path.unlink(missing_ok=True)
+
+
+def resolve_function(func_path: str) -> Callable:
+    """
+    Import a function from its dotted path, caching the result.
+
+    Args:
+        func_path: Fully qualified function path (e.g., "package.module.func")
+
+    Returns:
+        The resolved function
+    """
+    func = _FUNC_CACHE.get(func_path)
+    if func is None:
+        module_path, func_name = func_path.rsplit(".", 1)
+        func = getattr(importlib.import_module(module_path), func_name)
+        _FUNC_CACHE[func_path] = func
+    return func
+
+
+def _load_tool(config_dir: Path, tool_ref: ToolReference, tool_config: ToolConfig | None):
+    """
+    Load one tool's config and execute function and build its class.
+
+    Args:
+        config_dir: Path to the config directory containing toolbox.yml
+        tool_ref: Toolbox registry entry for the tool
+        tool_config: Already-validated config from the disk cache, if any
+
+    Returns:
+        Tuple of (tool_config, tool class)
+    """
+    # Load individual tool config
+    tool_config_path = config_dir / tool_ref.config
+    if tool_config is None:
+        tool_config = load_tool_config(tool_config_path)
+    else:
+        # Unpickled models are already validated; seed the in-memory
+        # memo so YAMLTool.__init__ doesn't parse the YAML again
+        prime_tool_config_cache(tool_config_path, tool_config)
+
+    # Import execute function dynamically
+    execute_func = resolve_function(tool_config.implementation.executeFunction)
+
+    # Create tool class
+    tool_class = create_tool_class(tool_config.tool.name, tool_config_path, execute_func)
+    return tool_config, tool_class
+
+
+def load_and_register_tools(config_dir: Path, toolbox_config: ToolboxConfig | None = None):
     """
     Load all enabled tools from YAML configuration.
 
@@ -68,44 +237,51 @@ def load_and_register_tools(config_dir: Path):
     - Creating tool classes for all enabled tools
     - Importing execute functions dynamically
 
+    Tools are registered in toolbox.yml order.
+
+    Parsed configs are cached in CONFIG_CACHE_FILENAME inside config_dir and
+    reused until toolbox.yml or any enabled tool's YAML changes.
+
     Args:
         config_dir: Path to the config directory containing toolbox.yml
+        toolbox_config: Already-loaded toolbox configuration to reuse instead
+            of reading toolbox.yml (bypasses the on-disk config cache)
 
     Returns:
         Tuple of (toolbox_config, list of tool classes)
     """
     tool_classes = []
+    tool_configs = {}
+    supplied = toolbox_config is not None
 
-    # Load toolbox configuration
-    toolbox_config = load_toolbox_config(config_dir)
-    print(f"Loading {len(toolbox_config.tools)} tools from config...")
-
-    for tool_ref in toolbox_config.tools:
-        if not tool_ref.enabled:
-            continue
+    # Load toolbox configuration, preferring the on-disk config cache
+    cached = None
+    if toolbox_config is None:
+        cached = _read_config_cache(config_dir)
+        if cached is not None:
+            toolbox_config, tool_configs = cached
+        else:
+            toolbox_config = load_toolbox_config(config_dir)
+    logger.info("Loading %d tools from config...", len(toolbox_config.tools))
 
+    enabled_tools = toolbox_config.enabled_tools
+    for tool_ref in enabled_tools:
         try:
-            # Load individual tool config
-            tool_config_path = config_dir / tool_ref.config
-            tool_config = load_tool_config(tool_config_path)
-
-            # Import execute function dynamically
-            func_path = tool_config.implementation.executeFunction
-            module_path, func_name = func_path.rsplit(".", 1)
-            module = importlib.import_module(module_path)
-            execute_func = getattr(module, func_name)
-
-            # Create tool class
-            tool_class = create_tool_class(tool_config.tool.name, tool_config_path, execute_func)
-            tool_classes.append(tool_class)
-
-            print(f"  ✓ Registered: {tool_class.__name__} -> {tool_config.tool.label}")
-
+            tool_config, tool_class = _load_tool(
+                config_dir, tool_ref, tool_configs.get(tool_ref.name)
+            )
         except Exception as e:
-            print(f"  ✗ Error loading tool {tool_ref.name}: {e}")
-            import traceback
+            logger.exception("  ✗ Error loading tool %s: %s", tool_ref.name, e)
+            continue
+
+        tool_configs[tool_ref.name] = tool_config
+        tool_classes.append(tool_class)
+        logger.info("  ✓ Registered: %s -> %s", tool_class.__name__, tool_config.tool.label)
 
-            traceback.print_exc()
+    # Only cache complete results so load errors are reported on every load;
+    # a caller-supplied toolbox config may not match toolbox.yml on disk
+    if cached is None and not supplied and len(tool_configs) == len(enabled_tools):
+        _write_config_cache(config_dir, toolbox_config, tool_configs)
 
-    print(f"Successfully loaded {len(tool_classes)} tool classes")
+    logger.info("Successfully loaded %d tool classes", len(tool_classes))
     return toolbox_config, tool_classes
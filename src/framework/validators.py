@@ -1,11 +1,11 @@
 """Validation utilities for tool configuration and runtime parameters."""
 
-import re
+from collections.abc import Callable
 from typing import Any
 
 import arcpy
 
-from src.framework.config import ToolConfig, ValidationCheck
+from src.framework.config import ParameterConfig, ToolConfig, ValidationCheck
 
 
 class ValidationError(Exception):
@@ -85,53 +85,112 @@ def validate_parameter(param_name: str, value: Any, config: ToolConfig, messages
         ValidationError: If validation fails
     """
     # Find parameter config with this name
-    param_config = next(
-        (p for p in config.parameters if p.name == param_name),
-        None,
-    )
+    param_config = config.parameters_by_name.get(param_name)
 
     if not param_config or not param_config.validation:
         return
 
-    # Run each validation check
-    for check in param_config.validation:
-        _run_check(param_name, value, check, messages)
+    get_parameter_validator(param_config)(value)
+
+
+def _check_greater_than(value: Any, check: ValidationCheck, error_msg: str) -> None:
+    if value is None or value <= check.value:
+        raise ValidationError(f"{error_msg} (must be > {check.value}, got {value})")
+
+
+def _check_less_than(value: Any, check: ValidationCheck, error_msg: str) -> None:
+    if value is None or value >= check.value:
+        raise ValidationError(f"{error_msg} (must be < {check.value}, got {value})")
+
+
+def _check_min_value(value: Any, check: ValidationCheck, error_msg: str) -> None:
+    if value is None or value < check.value:
+        raise ValidationError(f"{error_msg} (must be >= {check.value}, got {value})")
+
+
+def _check_max_value(value: Any, check: ValidationCheck, error_msg: str) -> None:
+    if value is None or value > check.value:
+        raise ValidationError(f"{error_msg} (must be <= {check.value}, got {value})")
+
+
+def _check_one_of(value: Any, check: ValidationCheck, error_msg: str) -> None:
+    try:
+        allowed = value in check.value_set
+    except TypeError:
+        # Unhashable values (lists, dicts) can never equal an allowed str/number
+        allowed = False
+    if not allowed:
+        raise ValidationError(f"{error_msg} (must be one of {check.values}, got {value})")
+
+
+def _check_not_empty(value: Any, check: ValidationCheck, error_msg: str) -> None:
+    # isspace() scans in place where strip() would copy the string
+    if not value or (isinstance(value, str) and value.isspace()):
+        raise ValidationError(f"{error_msg} (value cannot be empty)")
+
+
+def _check_regex(value: Any, check: ValidationCheck, error_msg: str) -> None:
+    pattern = check.compiled_pattern
+    if not isinstance(value, str) or not pattern or not pattern.match(value):
+        raise ValidationError(f"{error_msg} (must match pattern {check.pattern})")
+
+
+# Validation check handlers keyed by ValidationCheck.type
+_CHECKS: dict[str, Callable[[Any, ValidationCheck, str], None]] = {
+    "greater_than": _check_greater_than,
+    "less_than": _check_less_than,
+    "min_value": _check_min_value,
+    "max_value": _check_max_value,
+    "one_of": _check_one_of,
+    "not_empty": _check_not_empty,
+    "regex": _check_regex,
+}
 
 
 def _run_check(param_name: str, value: Any, check: ValidationCheck, messages=None) -> None:
     """Run a single validation check."""
-    error_msg = check.message or f"Validation failed for {param_name}"
+    handler = _CHECKS.get(check.type)
+    if handler:
+        handler(value, check, check.message or f"Validation failed for {param_name}")
 
-    if check.type == "greater_than":
-        if value is None or value <= check.value:
-            raise ValidationError(f"{error_msg} (must be > {check.value}, got {value})")
 
-    elif check.type == "less_than":
-        if value is None or value >= check.value:
-            raise ValidationError(f"{error_msg} (must be < {check.value}, got {value})")
+def build_parameter_validator(param_config: ParameterConfig) -> Callable[[Any], None]:
+    """
+    Compose a parameter's validation checks into a single function.
 
-    elif check.type == "min_value":
-        if value is None or value < check.value:
-            raise ValidationError(f"{error_msg} (must be >= {check.value}, got {value})")
+    Handlers and error messages are resolved once, so validating a value only
+    runs the checks themselves.
 
-    elif check.type == "max_value":
-        if value is None or value > check.value:
-            raise ValidationError(f"{error_msg} (must be <= {check.value}, got {value})")
+    Args:
+        param_config: Parameter configuration with validation rules
 
-    elif check.type == "one_of":
-        if value not in check.values:
-            raise ValidationError(f"{error_msg} (must be one of {check.values}, got {value})")
+    Returns:
+        Function that raises ValidationError if a value fails any check
+    """
+    steps = tuple(
+        (handler, check, check.message or f"Validation failed for {param_config.name}")
+        for check in param_config.validation or ()
+        if (handler := _CHECKS.get(check.type))
+    )
+
+    def validate(value: Any) -> None:
+        for handler, check, error_msg in steps:
+            handler(value, check, error_msg)
+
+    return validate
 
-    elif check.type == "not_empty":
-        if not value or (isinstance(value, str) and not value.strip()):
-            raise ValidationError(f"{error_msg} (value cannot be empty)")
 
-    elif check.type == "regex":
-        if not isinstance(value, str) or not check.pattern or not re.match(check.pattern, value):
-            raise ValidationError(f"{error_msg} (must match pattern {check.pattern})")
+def get_parameter_validator(param_config: ParameterConfig) -> Callable[[Any], None]:
+    """Return the parameter's composed validator, building it on first use."""
+    validator = param_config._validator
+    if validator is None:
+        validator = param_config._validator = build_parameter_validator(param_config)
+    return validator
 
 
-def validate_all_parameters(parameters, config: ToolConfig, messages=None) -> None:
+def validate_all_parameters(
+    parameters, config: ToolConfig, messages=None, collect_errors: bool = False
+) -> None:
     """
     Validate all parameters with rules defined in YAML.
 
@@ -139,20 +198,29 @@ def validate_all_parameters(parameters, config: ToolConfig, messages=None) -> No
         parameters: ArcGIS tool parameters
         config: Tool configuration containing validation rules
         messages: Optional ArcGIS messages object
+        collect_errors: If True, validate every parameter and raise one
+            ValidationError listing all failures (one line per parameter)
+            instead of stopping at the first
 
     Raises:
         ValidationError: If any validation fails
     """
-    # Iterate through parameter configs with validation rules
-    for param_config in config.parameters:
-        if not param_config.validation:
-            continue
+    errors: list[str] = []
 
+    # Only parameters with validation rules, selected once per config
+    for param_config in config.validated_parameters:
         param = parameters[param_config.index]
 
         # Use .value for proper type (numbers, booleans)
         # ArcGIS automatically converts to correct Python type
-        value = param.value
+        if not collect_errors:
+            get_parameter_validator(param_config)(param.value)
+            continue
+
+        try:
+            get_parameter_validator(param_config)(param.value)
+        except ValidationError as e:
+            errors.append(str(e))
 
-        for check in param_config.validation:
-            _run_check(param_config.name, value, check, messages)
+    if errors:
+        raise ValidationError("\n".join(errors))
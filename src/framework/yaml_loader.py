@@ -0,0 +1,16 @@
+"""YAML loading helpers shared by the configuration loaders."""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    # libyaml-backed loader; much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
+
+
+def load_yaml(stream: IO[str] | IO[bytes] | str | bytes) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
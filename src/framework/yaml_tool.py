@@ -2,45 +2,31 @@
 
 from pathlib import Path
 
-import arcpy
-
 from src.framework.config import ToolConfig, load_tool_config
+from src.framework.discovery import discover_all
+
+# From src/framework/yaml_tool.py, go up to src/
+_SRC_DIR = Path(__file__).resolve().parent.parent
+_LEGACY_TOOLS_DIR = _SRC_DIR / "tools" / "config" / "tools"
 
 
 class YAMLTool:
     """Base class for tools configured via YAML."""
 
-    def __init__(self, tool_name: str):
+    __slots__ = ("tool_name", "config", "label", "description", "category", "canRunInBackground")
+
+    def __init__(self, tool_name: str, config_path: Path | None = None):
         """
         Initialize tool from YAML configuration.
 
         Args:
             tool_name: Name of the tool (must match YAML filename or folder name)
+            config_path: Path to the tool's YAML config (searched for if omitted)
         """
         self.tool_name = tool_name
 
-        # Load tool configuration from individual YAML file
-        # From src/framework/yaml_tool.py, go up to src/
-        toolbox_path = Path(__file__).parent.parent
-
-        # Try new folder-per-tool structure first (standalone)
-        config_path = toolbox_path / "tools" / tool_name / "tool.yml"
-
-        # Try searching in toolsets (e.g., spatial_analysis/buffer_analysis/tool.yml)
-        if not config_path.exists():
-            for toolset_dir in (toolbox_path / "tools").iterdir():
-                if toolset_dir.is_dir() and toolset_dir.name not in ["config"]:
-                    toolset_tool_path = toolset_dir / tool_name / "tool.yml"
-                    if toolset_tool_path.exists():
-                        config_path = toolset_tool_path
-                        break
-
-        # Fall back to legacy flat structure if not found
-        if not config_path.exists():
-            config_path = toolbox_path / "tools" / "config" / "tools" / f"{tool_name}.yml"
-
-        if not config_path.exists():
-            raise FileNotFoundError(f"Tool config not found: {config_path}")
+        if config_path is None:
+            config_path = self._find_config_path(tool_name)
 
         # Load and validate config
         self.config: ToolConfig = load_tool_config(config_path)
@@ -51,42 +37,60 @@ class YAMLTool:
         self.category = self.config.tool.category
         self.canRunInBackground = self.config.tool.canRunInBackground
 
+    @staticmethod
+    def _find_config_path(tool_name: str) -> Path:
+        """Locate a tool's YAML config under src/tools/."""
+        # Folder-per-tool structure, standalone or inside a toolset
+        # (e.g., spatial_analysis/buffer_analysis/tool.yml)
+        tool_dir = discover_all(_SRC_DIR).tool_by_name.get(tool_name)
+        if tool_dir is not None:
+            return tool_dir / "tool.yml"
+
+        # Fall back to legacy flat structure; load_tool_config raises
+        # FileNotFoundError if it doesn't exist either
+        return _LEGACY_TOOLS_DIR / f"{tool_name}.yml"
+
     def getParameterInfo(self):
         """Build parameters from YAML configuration."""
-        # Sort parameters by index to ensure correct order
-        sorted_params = sorted(self.config.parameters, key=lambda p: p.index)
+        # Imported lazily so config loading and discovery don't pay for arcpy
+        import arcpy
 
         parameters = []
 
-        for param_config in sorted_params:
+        # Recipes are pre-sorted by index and computed once per config
+        for (
+            name,
+            display_name,
+            datatype,
+            parameter_type,
+            direction,
+            default_value,
+            param_filter,
+            columns,
+        ) in self.config.parameter_recipes:
             # Create parameter
             param = arcpy.Parameter(
-                name=param_config.name,
-                displayName=param_config.displayName,
-                datatype=param_config.datatype,
-                parameterType=param_config.parameterType,
-                direction=param_config.direction,
+                name=name,
+                displayName=display_name,
+                datatype=datatype,
+                parameterType=parameter_type,
+                direction=direction,
             )
 
             # Set default value
-            if param_config.defaultValue is not None:
-                param.value = param_config.defaultValue
+            if default_value is not None:
+                param.value = default_value
 
             # Set filter if provided
-            if param_config.filter:
-                filter_config = param_config.filter
-                if filter_config.type == "Range":
-                    param.filter.type = "Range"  # type: ignore
-                    param.filter.list = [filter_config.min, filter_config.max]  # type: ignore
-                elif filter_config.type == "ValueList":
-                    param.filter.type = "ValueList"  # type: ignore
-                    param.filter.list = filter_config.values  # type: ignore
-                elif filter_config.type == "File":
-                    param.filter.list = filter_config.fileFilters  # type: ignore
+            if param_filter:
+                filter_type, filter_list = param_filter
+                if filter_type:
+                    param.filter.type = filter_type  # type: ignore
+                param.filter.list = filter_list  # type: ignore
 
             # Set columns for ValueTable
-            if param_config.columns:
-                param.columns = param_config.columns
+            if columns:
+                param.columns = columns
 
             parameters.append(param)
 
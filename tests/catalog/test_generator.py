@@ -9,7 +9,7 @@ from src.catalog.generator import (
     GeneratorError,
     GeneratorService,
 )
-from src.catalog.models import SourceType
+from src.catalog.models import SourceType, ToolReference
 from src.catalog.service import CatalogService
 
 
@@ -60,8 +60,6 @@ class TestToolResolution:
 
         # Manually add a tool reference with non-existent source
         # (bypass validation by directly modifying catalog)
-        from src.catalog.models import ToolReference
-
         catalog = catalog_service.load()
         toolbox = catalog.get_toolbox_by_id("test-toolbox")
         toolbox.tools.append(ToolReference(source_id="nonexistent-source", tool_path="tools/tool1"))
@@ -256,8 +254,6 @@ class TestBatchGeneration:
         catalog_service.add_toolbox("bad-toolbox", "Bad Toolbox", "bad.pyt", "Invalid")
 
         # Manually add tool reference with non-existent source
-        from src.catalog.models import ToolReference
-
         catalog = catalog_service.load()
         toolbox = catalog.get_toolbox_by_id("bad-toolbox")
         toolbox.tools.append(ToolReference(source_id="nonexistent", tool_path="tools/tool1"))
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from src.catalog.models import SourceType
+from src.catalog.models import Catalog, SourceType
 from src.catalog.service import (
     CatalogError,
     CatalogNotFoundError,
@@ -21,23 +21,92 @@ def temp_catalog_path(tmp_path):
 
 
 @pytest.fixture
-def service(temp_catalog_path):
-    """Fixture providing a CatalogService instance."""
-    return CatalogService(temp_catalog_path)
+def temp_workspace_path(tmp_path):
+    """Fixture providing a per-test workspace directory."""
+    return tmp_path / "workspace"
+
+
+@pytest.fixture
+def service(temp_catalog_path, temp_workspace_path):
+    """Fixture providing a CatalogService instance (backups disabled)."""
+    return CatalogService(temp_catalog_path, workspace_path=temp_workspace_path, backup=False)
+
+
+def _add_source(service, entity_id, name="Test"):
+    return service.add_source(entity_id, name, SourceType.LOCAL, path=Path(f"/{entity_id}"))
+
+
+def _add_toolbox(service, entity_id, name="Test"):
+    return service.add_toolbox(entity_id, name, Path(f"/{entity_id}.pyt"))
+
+
+# Per-entity dispatch for the CRUD tests shared by sources and toolboxes
+OPS = {
+    "source": {
+        "add": _add_source,
+        "get": CatalogService.get_source,
+        "update": CatalogService.update_source,
+        "remove": CatalogService.remove_source,
+        "find": Catalog.get_source_by_id,
+        "collection": "sources",
+        "updates": {"name": "Updated Name", "enabled": False},
+    },
+    "toolbox": {
+        "add": _add_toolbox,
+        "get": CatalogService.get_toolbox,
+        "update": CatalogService.update_toolbox,
+        "remove": CatalogService.remove_toolbox,
+        "find": Catalog.get_toolbox_by_id,
+        "collection": "toolboxes",
+        "updates": {"name": "Updated Name", "description": "New desc"},
+    },
+}
+
+
+def _seed(service):
+    """Create a source and toolbox with one tool assigned."""
+    service.add_source("src", "Source", SourceType.LOCAL, path=Path("/src"))
+    service.add_toolbox("tb", "Toolbox", Path("/tb.pyt"))
+    service.add_tool_to_toolbox("tb", "src", "tools/buffer")
+
+
+# Every catalog mutation, exercised once against a disk round-trip
+MUTATIONS = [
+    pytest.param(
+        lambda s: s.add_source("git", "Git", SourceType.GIT, url="https://github.com/user/repo"),
+        id="add_source",
+    ),
+    pytest.param(
+        lambda s: s.update_source("src", name="Renamed", enabled=False), id="update_source"
+    ),
+    pytest.param(lambda s: s.remove_source("src", force=True), id="remove_source"),
+    pytest.param(lambda s: s.add_toolbox("tb2", "Toolbox 2", Path("/tb2.pyt")), id="add_toolbox"),
+    pytest.param(lambda s: s.update_toolbox("tb", description="New desc"), id="update_toolbox"),
+    pytest.param(lambda s: s.remove_toolbox("tb"), id="remove_toolbox"),
+    pytest.param(lambda s: s.add_tool_to_toolbox("tb", "src", "tools/clip"), id="add_tool"),
+    pytest.param(
+        lambda s: s.update_tool_in_toolbox("tb", "src", "tools/buffer", alias="Alias"),
+        id="update_tool",
+    ),
+    pytest.param(
+        lambda s: s.remove_tool_from_toolbox("tb", "src", "tools/buffer"), id="remove_tool"
+    ),
+]
 
 
 class TestCatalogServiceBasics:
     """Tests for basic catalog operations."""
 
-    def test_init_default_path(self):
+    def test_init_default_path(self, tmp_path, monkeypatch):
         """Test service initialization with default path."""
+        monkeypatch.chdir(tmp_path)
         service = CatalogService()
-        expected = Path.home() / ".arcgis_yaml_toolbox" / "catalog.yml"
+        expected = tmp_path / "workspace" / "catalogs" / "default.yml"
         assert service.catalog_path == expected
 
-    def test_init_custom_path(self, temp_catalog_path):
+    def test_init_custom_path(self, temp_catalog_path, temp_workspace_path):
         """Test service initialization with custom path."""
-        service = CatalogService(temp_catalog_path)
+        service = CatalogService(temp_catalog_path, workspace_path=temp_workspace_path)
         assert service.catalog_path == temp_catalog_path
 
     def test_exists_false_initially(self, service):
@@ -93,19 +162,36 @@ class TestCatalogServiceBasics:
         service.add_source("test", "Test", SourceType.LOCAL, path=Path("/test"))
 
         # Load in new service instance
-        service2 = CatalogService(service.catalog_path)
+        service2 = CatalogService(service.catalog_path, workspace_path=service.workspace_path)
         loaded = service2.load()
 
         assert len(loaded.sources) == 1
         assert loaded.sources[0].id == "test"
 
-    def test_backup_created(self, service):
+    @pytest.mark.parametrize("mutate", MUTATIONS)
+    def test_mutation_persisted(self, service, mutate):
+        """Test each mutation is written to disk as held in memory."""
+        _seed(service)
+        mutate(service)
+        expected = service.catalog.model_dump()
+
+        assert service.load().model_dump() == expected
+
+    def test_backup_created(self, temp_catalog_path, temp_workspace_path):
         """Test backup is created when saving over existing file."""
+        service = CatalogService(temp_catalog_path, workspace_path=temp_workspace_path)
         service.create_new()
-        service.save()  # Second save should create backup
+        backup_path = service.save()  # Second save should create backup
+
+        assert backup_path is not None
+        assert backup_path.parent == service.catalog_path.parent
+        assert backup_path.name.endswith(".yml.bak")
+        assert backup_path.exists()
 
-        backup_files = list(service.catalog_path.parent.glob("*.bak"))
-        assert len(backup_files) == 1
+    def test_backup_disabled(self, service):
+        """Test no backup is created when the service has backups disabled."""
+        service.create_new()
+        assert service.save() is None
 
 
 class TestSourceManagement:
@@ -125,9 +211,7 @@ class TestSourceManagement:
         assert source.url == "https://github.com/user/repo"
         assert source.enabled is True
 
-        # Verify saved
-        catalog = service.load()
-        assert len(catalog.sources) == 1
+        assert len(service.catalog.sources) == 1
 
     def test_add_local_source(self, service):
         """Test adding a local source."""
@@ -142,25 +226,6 @@ class TestSourceManagement:
         assert source.type == SourceType.LOCAL
         assert source.path == Path("/local/tools")
 
-    def test_add_duplicate_source(self, service):
-        """Test adding source with duplicate ID fails."""
-        service.add_source("test", "Test", SourceType.LOCAL, path=Path("/test"))
-
-        with pytest.raises(CatalogError) as exc_info:
-            service.add_source("test", "Test2", SourceType.LOCAL, path=Path("/test2"))
-
-        assert "already exists" in str(exc_info.value)
-
-    def test_get_source(self, service):
-        """Test getting source by ID."""
-        service.add_source("test", "Test", SourceType.LOCAL, path=Path("/test"))
-
-        source = service.get_source("test")
-        assert source is not None
-        assert source.id == "test"
-
-        assert service.get_source("nonexistent") is None
-
     def test_list_sources(self, service):
         """Test listing all sources."""
         service.add_source("src1", "Source 1", SourceType.LOCAL, path=Path("/src1"))
@@ -173,38 +238,6 @@ class TestSourceManagement:
         assert len(enabled_only) == 1
         assert enabled_only[0].id == "src1"
 
-    def test_update_source(self, service):
-        """Test updating source properties."""
-        service.add_source("test", "Test", SourceType.LOCAL, path=Path("/test"))
-
-        updated = service.update_source("test", name="Updated Name", enabled=False)
-        assert updated.name == "Updated Name"
-        assert updated.enabled is False
-
-        # Verify saved
-        catalog = service.load()
-        source = catalog.get_source_by_id("test")
-        assert source is not None
-        assert source.name == "Updated Name"
-
-    def test_update_nonexistent_source(self, service):
-        """Test updating nonexistent source fails."""
-        with pytest.raises(CatalogError):
-            service.update_source("nonexistent", name="Test")
-
-    def test_remove_source(self, service):
-        """Test removing a source."""
-        service.add_source("test", "Test", SourceType.LOCAL, path=Path("/test"))
-        service.remove_source("test")
-
-        catalog = service.load()
-        assert len(catalog.sources) == 0
-
-    def test_remove_nonexistent_source(self, service):
-        """Test removing nonexistent source fails."""
-        with pytest.raises(CatalogError):
-            service.remove_source("nonexistent")
-
     def test_remove_source_referenced_by_toolbox(self, service):
         """Test removing source referenced by toolbox fails without force."""
         service.add_source("src", "Source", SourceType.LOCAL, path=Path("/src"))
@@ -224,7 +257,7 @@ class TestSourceManagement:
 
         service.remove_source("src", force=True)
 
-        catalog = service.load()
+        catalog = service.catalog
         assert len(catalog.sources) == 0
         # Toolbox still exists with broken reference
         assert len(catalog.toolboxes) == 1
@@ -249,28 +282,7 @@ class TestToolboxManagement:
         assert toolbox.created is not None
         assert toolbox.auto_regenerate is True
 
-        # Verify saved
-        catalog = service.load()
-        assert len(catalog.toolboxes) == 1
-
-    def test_add_duplicate_toolbox(self, service):
-        """Test adding toolbox with duplicate ID fails."""
-        service.add_toolbox("test", "Test", Path("/test.pyt"))
-
-        with pytest.raises(CatalogError) as exc_info:
-            service.add_toolbox("test", "Test2", Path("/test2.pyt"))
-
-        assert "already exists" in str(exc_info.value)
-
-    def test_get_toolbox(self, service):
-        """Test getting toolbox by ID."""
-        service.add_toolbox("test", "Test", Path("/test.pyt"))
-
-        toolbox = service.get_toolbox("test")
-        assert toolbox is not None
-        assert toolbox.id == "test"
-
-        assert service.get_toolbox("nonexistent") is None
+        assert len(service.catalog.toolboxes) == 1
 
     def test_list_toolboxes(self, service):
         """Test listing all toolboxes."""
@@ -280,38 +292,64 @@ class TestToolboxManagement:
         toolboxes = service.list_toolboxes()
         assert len(toolboxes) == 2
 
-    def test_update_toolbox(self, service):
-        """Test updating toolbox properties."""
-        service.add_toolbox("test", "Test", Path("/test.pyt"))
 
-        updated = service.update_toolbox("test", name="Updated Name", description="New desc")
-        assert updated.name == "Updated Name"
-        assert updated.description == "New desc"
-        assert updated.modified is not None
+@pytest.mark.parametrize("entity", ["source", "toolbox"])
+class TestEntityManagement:
+    """CRUD tests shared by sources and toolboxes."""
 
-        # Verify saved
-        catalog = service.load()
-        toolbox = catalog.get_toolbox_by_id("test")
-        assert toolbox is not None
-        assert toolbox.name == "Updated Name"
+    def test_add_duplicate(self, service, entity):
+        """Test adding an entity with duplicate ID fails."""
+        ops = OPS[entity]
+        ops["add"](service, "test")
+
+        with pytest.raises(CatalogError) as exc_info:
+            ops["add"](service, "test", name="Test2")
+
+        assert "already exists" in str(exc_info.value)
+
+    def test_get(self, service, entity):
+        """Test getting an entity by ID."""
+        ops = OPS[entity]
+        ops["add"](service, "test")
+
+        found = ops["get"](service, "test")
+        assert found is not None
+        assert found.id == "test"
+
+        assert ops["get"](service, "nonexistent") is None
+
+    def test_update(self, service, entity):
+        """Test updating entity properties."""
+        ops = OPS[entity]
+        ops["add"](service, "test")
+
+        updated = ops["update"](service, "test", **ops["updates"])
+        for key, value in ops["updates"].items():
+            assert getattr(updated, key) == value
+        if entity == "toolbox":
+            assert updated.modified is not None
+
+        found = ops["find"](service.catalog, "test")
+        assert found is not None
+        assert found.name == "Updated Name"
 
-    def test_update_nonexistent_toolbox(self, service):
-        """Test updating nonexistent toolbox fails."""
+    def test_update_nonexistent(self, service, entity):
+        """Test updating nonexistent entity fails."""
         with pytest.raises(CatalogError):
-            service.update_toolbox("nonexistent", name="Test")
+            OPS[entity]["update"](service, "nonexistent", name="Test")
 
-    def test_remove_toolbox(self, service):
-        """Test removing a toolbox."""
-        service.add_toolbox("test", "Test", Path("/test.pyt"))
-        service.remove_toolbox("test")
+    def test_remove(self, service, entity):
+        """Test removing an entity."""
+        ops = OPS[entity]
+        ops["add"](service, "test")
+        ops["remove"](service, "test")
 
-        catalog = service.load()
-        assert len(catalog.toolboxes) == 0
+        assert len(getattr(service.catalog, ops["collection"])) == 0
 
-    def test_remove_nonexistent_toolbox(self, service):
-        """Test removing nonexistent toolbox fails."""
+    def test_remove_nonexistent(self, service, entity):
+        """Test removing nonexistent entity fails."""
         with pytest.raises(CatalogError):
-            service.remove_toolbox("nonexistent")
+            OPS[entity]["remove"](service, "nonexistent")
 
 
 class TestToolAssignment:
@@ -328,9 +366,7 @@ class TestToolAssignment:
         assert tool_ref.tool_path == "tools/buffer"
         assert tool_ref.enabled is True
 
-        # Verify saved
-        catalog = service.load()
-        toolbox = catalog.get_toolbox_by_id("tb")
+        toolbox = service.catalog.get_toolbox_by_id("tb")
         assert toolbox is not None
         assert len(toolbox.tools) == 1
 
@@ -404,9 +440,7 @@ class TestToolAssignment:
         assert updated.enabled is False
         assert updated.alias == "New Alias"
 
-        # Verify saved
-        catalog = service.load()
-        toolbox = catalog.get_toolbox_by_id("tb")
+        toolbox = service.catalog.get_toolbox_by_id("tb")
         assert toolbox is not None
         tool = toolbox.tools[0]
         assert tool.enabled is False
@@ -429,8 +463,7 @@ class TestToolAssignment:
 
         service.remove_tool_from_toolbox("tb", "src", "tools/buffer")
 
-        catalog = service.load()
-        toolbox = catalog.get_toolbox_by_id("tb")
+        toolbox = service.catalog.get_toolbox_by_id("tb")
         assert toolbox is not None
         assert len(toolbox.tools) == 0
 
@@ -1,13 +1,14 @@
 """Pytest configuration and fixtures."""
 
+import copy
 import sys
+import types
 from pathlib import Path
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
-# Mock arcpy before any imports to allow testing without ArcGIS Pro
-_mock_arcpy = MagicMock()
+from src.framework.discovery import discover_all
 
 
 # Mock Parameter class
@@ -21,40 +22,54 @@ class MockParameter:
         self.description = ""
         self.value = None
         self.valueAsText = None
-        self.filter = Mock()
-        self.filter.type = None
-        self.filter.list = []
+        self.filter = types.SimpleNamespace(type=None, list=[])
         self.columns = None
 
 
-_mock_arcpy.Parameter = MockParameter
-_mock_arcpy.Exists = Mock(return_value=True)
+def _noop(*args, **kwargs):
+    return None
 
-# Mock Describe
-mock_desc = Mock()
-mock_desc.shapeType = "Polygon"
-mock_sr = Mock()
-mock_sr.name = "WGS_1984_Web_Mercator_Auxiliary_Sphere"
-mock_sr.factoryCode = 3857
-mock_desc.spatialReference = mock_sr
-_mock_arcpy.Describe = Mock(return_value=mock_desc)
 
-# Mock management
-_mock_arcpy.management = Mock()
-_mock_arcpy.management.GetCount = Mock(return_value=["100"])
-_mock_arcpy.management.CreateFileGDB = Mock()
-_mock_arcpy.management.CreateFeatureclass = Mock()
+def _install_arcpy_stub() -> None:
+    """Install a mock arcpy module in sys.modules.
 
-# Mock analysis
-_mock_arcpy.analysis = Mock()
-_mock_arcpy.analysis.Buffer = Mock()
-_mock_arcpy.analysis.Clip = Mock()
+    A plain module stub keeps attribute access cheap.
+    """
+    stub = types.ModuleType("arcpy")
+    stub.Parameter = MockParameter
+    stub.Exists = lambda *args, **kwargs: True
+
+    # Mock Describe
+    mock_sr = types.SimpleNamespace(name="WGS_1984_Web_Mercator_Auxiliary_Sphere", factoryCode=3857)
+    mock_desc = types.SimpleNamespace(shapeType="Polygon", spatialReference=mock_sr)
+    stub.Describe = lambda *args, **kwargs: mock_desc
+
+    # Mock geoprocessing messages
+    stub.AddMessage = _noop
+    stub.AddWarning = _noop
+    stub.AddError = _noop
+
+    # Mock management
+    stub.management = types.SimpleNamespace(
+        GetCount=lambda *args, **kwargs: ["100"],
+        CreateFileGDB=_noop,
+        CreateFeatureclass=_noop,
+    )
+
+    # Mock analysis
+    stub.analysis = types.SimpleNamespace(Buffer=_noop, Clip=_noop)
+
+    # Mock da cursor
+    stub.da = types.SimpleNamespace()
+
+    sys.modules["arcpy"] = stub
 
-# Mock da cursor
-_mock_arcpy.da = Mock()
 
-# Install mock in sys.modules before any other imports
-sys.modules["arcpy"] = _mock_arcpy
+# Mock arcpy before any imports to allow testing without ArcGIS Pro.
+# The sentinel keeps this single-shot if the conftest is loaded more than once.
+if not getattr(sys, "_arcpy_stub_installed", False):
+    _install_arcpy_stub()
+    sys._arcpy_stub_installed = True
 
 
 def pytest_configure(config):
@@ -70,79 +85,67 @@ def temp_workspace(tmp_path):
     return tmp_path / "test_workspace"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_arcpy():
     """Return the global mock arcpy module."""
     return sys.modules["arcpy"]
 
 
-@pytest.fixture
-def toolbox_root():
+@pytest.fixture(scope="session")
+def source_root():
+    """Get path to the example source tree."""
+    return Path(__file__).parent.parent / "examples" / "sources" / "basic-tools"
+
+
+@pytest.fixture(scope="session")
+def toolbox_root(source_root):
     """Get path to toolboxes root directory."""
-    return Path(__file__).parent.parent / "examples" / "sources" / "basic-tools" / "toolboxes"
+    return source_root / "toolboxes"
 
 
-@pytest.fixture
-def tools_root():
+@pytest.fixture(scope="session")
+def tools_root(source_root):
     """Get path to tools root directory."""
-    return Path(__file__).parent.parent / "examples" / "sources" / "basic-tools" / "tools"
+    return source_root / "tools"
 
 
-@pytest.fixture
-def all_toolboxes(toolbox_root):
+@pytest.fixture(scope="session")
+def discovery_index(source_root):
+    """Index of the example toolboxes and tools, walked once per session."""
+    return discover_all(source_root)
+
+
+@pytest.fixture(scope="session")
+def all_toolboxes(discovery_index):
     """Discover all toolbox directories (contain toolbox.yml)."""
-    toolboxes = []
-    for item in toolbox_root.iterdir():
-        if item.is_dir() and (item / "toolbox.yml").exists():
-            toolboxes.append(item)
-    return toolboxes
+    return discovery_index.toolboxes
 
 
-@pytest.fixture
-def all_tools(tools_root):
+@pytest.fixture(scope="session")
+def all_tools(discovery_index):
     """Discover all tool directories (contain tool.yml).
 
     Searches both standalone tools and tools within toolsets.
-    Returns list of tuples: (tool_path, tool_name)
+    Returns tuple of tuples: (tool_path, tool_name)
     """
-    tools = []
-
-    def find_tools(directory: Path, depth: int = 0):
-        """Recursively find tool directories (max depth 2 for toolsets)."""
-        if depth > 2:  # Prevent infinite recursion
-            return
-
-        for item in directory.iterdir():
-            if not item.is_dir() or item.name.startswith("_"):
-                continue
+    return discovery_index.tools
 
-            # Check if this is a tool directory
-            tool_yml = item / "tool.yml"
-            if tool_yml.exists():
-                tools.append((item, item.name))
-            else:
-                # Check subdirectories (for toolsets)
-                find_tools(item, depth + 1)
 
-    find_tools(tools_root)
-    return tools
-
-
-@pytest.fixture
-def get_toolbox(toolbox_root):
+@pytest.fixture(scope="session")
+def get_toolbox(toolbox_root, discovery_index):
     """Factory fixture to get a specific toolbox by name."""
 
     def _get_toolbox(name: str) -> Path:
         toolbox_path = toolbox_root / name
-        if not toolbox_path.exists():
+        if toolbox_path not in discovery_index.toolboxes:
             raise FileNotFoundError(f"Toolbox not found: {name}")
         return toolbox_path
 
     return _get_toolbox
 
 
-@pytest.fixture
-def get_tool(tools_root):
+@pytest.fixture(scope="session")
+def get_tool(tools_root, discovery_index):
     """Factory fixture to get a specific tool by path.
 
     Usage:
@@ -152,16 +155,16 @@ def get_tool(tools_root):
 
     def _get_tool(tool_path: str) -> Path:
         tool = tools_root / tool_path
-        if not tool.exists():
+        if discovery_index.tool_by_name.get(tool.name) != tool:
             raise FileNotFoundError(f"Tool not found: {tool_path}")
         return tool
 
     return _get_tool
 
 
-@pytest.fixture
-def mock_messages():
-    """Mock ArcGIS messages object."""
+@pytest.fixture(scope="session")
+def _messages_template():
+    """Mock ArcGIS messages object shared by the whole session."""
     messages = Mock()
     messages.addMessage = Mock()
     messages.addWarningMessage = Mock()
@@ -169,39 +172,25 @@ def mock_messages():
     return messages
 
 
+@pytest.fixture
+def mock_messages(_messages_template):
+    """Mock ArcGIS messages object, reset so each test sees no prior calls."""
+    _messages_template.reset_mock(return_value=True, side_effect=True)
+    return _messages_template
+
+
+# Mock buffer tool parameters; tests only read and assign value/valueAsText
+_PARAMETERS_TEMPLATE = (
+    types.SimpleNamespace(valueAsText="C:/data/test.shp", value=None),  # input_features
+    types.SimpleNamespace(valueAsText=None, value=100.0),  # buffer_distance
+    types.SimpleNamespace(valueAsText="meters", value="meters"),  # buffer_units
+    types.SimpleNamespace(valueAsText=None, value=True),  # dissolve_output
+    types.SimpleNamespace(valueAsText="C:/data/buffer_output.shp", value=None),  # output_features
+)
+
+
 @pytest.fixture
 def mock_parameters():
     """Create mock ArcGIS parameters for buffer tool."""
-    params = []
-
-    # input_features
-    p = Mock()
-    p.valueAsText = "C:/data/test.shp"
-    p.value = None
-    params.append(p)
-
-    # buffer_distance
-    p = Mock()
-    p.valueAsText = None
-    p.value = 100.0
-    params.append(p)
-
-    # buffer_units
-    p = Mock()
-    p.valueAsText = "meters"
-    p.value = "meters"  # Set value for validation
-    params.append(p)
-
-    # dissolve_output
-    p = Mock()
-    p.valueAsText = None
-    p.value = True
-    params.append(p)
-
-    # output_features
-    p = Mock()
-    p.valueAsText = "C:/data/buffer_output.shp"
-    p.value = None
-    params.append(p)
-
-    return params
+    # Shallow copies so assignments in one test do not leak into the next
+    return [copy.copy(param) for param in _PARAMETERS_TEMPLATE]
@@ -1,13 +1,22 @@
 """Tests for YAML configuration loading and validation."""
 
+import shutil
+import textwrap
+
 import pytest
 
+from scripts import validate_config
+from src.framework.config import (
+    FilterConfig,
+    ParameterConfig,
+    load_tool_config,
+    load_toolbox_config,
+)
+
 
 @pytest.mark.unit
 def test_load_toolbox_config(get_toolbox):
     """Test loading main toolbox configuration."""
-    from src.framework.config import load_toolbox_config
-
     config = load_toolbox_config(get_toolbox("spatial_analysis"))
 
     assert config.toolbox.label == "Spatial Analysis"
@@ -24,8 +33,6 @@ def test_load_toolbox_config(get_toolbox):
 @pytest.mark.unit
 def test_tool_config_parameter_validation(get_tool):
     """Test that tool configs have valid parameter indices."""
-    from src.framework.config import load_tool_config
-
     # Buffer tool
     buffer_config = load_tool_config(get_tool("spatial_analysis/buffer_analysis") / "tool.yml")
     assert len(buffer_config.parameters) == 5
@@ -41,11 +48,19 @@ def test_tool_config_parameter_validation(get_tool):
     assert indices == {0, 1, 2}
 
 
+@pytest.mark.unit
+def test_implementation_options(get_tool):
+    """Test tool-specific implementation options are loaded and default to empty."""
+    clip_config = load_tool_config(get_tool("spatial_analysis/clip_features") / "tool.yml")
+    buffer_config = load_tool_config(get_tool("spatial_analysis/buffer_analysis") / "tool.yml")
+
+    assert clip_config.implementation.options == {"report_input_count": False}
+    assert buffer_config.implementation.options == {}
+
+
 @pytest.mark.unit
 def test_parameter_config_validation():
     """Test parameter configuration validation."""
-    from src.framework.config import FilterConfig, ParameterConfig
-
     # Valid parameter with range filter
     param = ParameterConfig(
         name="test_param",
@@ -77,46 +92,60 @@ def test_parameter_config_validation():
 @pytest.mark.unit
 def test_invalid_tool_config_duplicate_indices(tmp_path):
     """Test that invalid tool config with duplicate indices fails validation."""
-    import yaml
-
-    from src.framework.config import load_tool_config
-
-    # Create invalid config with duplicate indices
-    invalid_config = {
-        "tool": {
-            "name": "test_tool",
-            "label": "Test Tool",
-            "description": "Test",
-            "category": "Test",
-        },
-        "implementation": {
-            "executeFunction": "test.execute",
-        },
-        "parameters": [
-            {
-                "name": "param1",
-                "displayName": "Param 1",
-                "datatype": "GPString",
-                "parameterType": "Required",
-                "direction": "Input",
-                "index": 0,
-            },
-            {
-                "name": "param2",
-                "displayName": "Param 2",
-                "datatype": "GPString",
-                "parameterType": "Required",
-                "direction": "Input",
-                "index": 0,  # Duplicate index!
-            },
-        ],
-    }
-
-    # Write to temp file
+    # Write invalid config with duplicate indices
     test_config_path = tmp_path / "test_tool.yml"
-    with open(test_config_path, "w") as f:
-        yaml.dump(invalid_config, f)
+    test_config_path.write_text(
+        textwrap.dedent(
+            """\
+            tool:
+              name: test_tool
+              label: Test Tool
+              description: Test
+              category: Test
+            implementation:
+              executeFunction: test.execute
+            parameters:
+              - name: param1
+                displayName: Param 1
+                datatype: GPString
+                parameterType: Required
+                direction: Input
+                index: 0
+              - name: param2
+                displayName: Param 2
+                datatype: GPString
+                parameterType: Required
+                direction: Input
+                index: 0  # Duplicate index!
+            """
+        )
+    )
 
     # Should raise validation error
     with pytest.raises(Exception, match="Duplicate parameter indices"):
         load_tool_config(test_config_path)
+
+
+@pytest.mark.unit
+def test_validate_all_configs_reuses_loaded_toolbox(source_root, tmp_path, monkeypatch):
+    """Test a supplied toolbox config is used instead of reading toolbox.yml again."""
+    # The script validates <repo>/src/toolboxes; point it at a copy of the examples
+    shutil.copytree(source_root, tmp_path / "src")
+    monkeypatch.setattr(
+        validate_config, "__file__", str(tmp_path / "scripts" / "validate_config.py")
+    )
+
+    spatial_dir = tmp_path / "src" / "toolboxes" / "spatial_analysis"
+    spatial_config = load_toolbox_config(spatial_dir)
+
+    loaded = []
+
+    def recording_load(toolbox_dir):
+        loaded.append(toolbox_dir.name)
+        return load_toolbox_config(toolbox_dir)
+
+    monkeypatch.setattr(validate_config, "load_toolbox_config", recording_load)
+
+    assert validate_config.validate_all_configs({"spatial_analysis": spatial_config})
+    assert "spatial_analysis" not in loaded
+    assert loaded == ["utilities"]
@@ -2,6 +2,9 @@
 
 import pytest
 
+from src.framework.config import load_tool_config, load_toolbox_config
+from src.framework.discovery import discover_all
+
 
 @pytest.mark.unit
 def test_discover_all_toolboxes(all_toolboxes):
@@ -35,8 +38,6 @@ def test_discover_all_tools(all_tools):
 @pytest.mark.unit
 def test_all_tools_have_valid_config(all_tools):
     """Test that all discovered tools have valid YAML configuration."""
-    from src.framework.config import load_tool_config
-
     for tool_path, tool_name in all_tools:
         config = load_tool_config(tool_path / "tool.yml")
         assert config.tool.name == tool_name
@@ -47,8 +48,6 @@ def test_all_tools_have_valid_config(all_tools):
 @pytest.mark.unit
 def test_all_toolboxes_have_valid_config(all_toolboxes):
     """Test that all discovered toolboxes have valid YAML configuration."""
-    from src.framework.config import load_toolbox_config
-
     for toolbox_path in all_toolboxes:
         config = load_toolbox_config(toolbox_path)
         assert len(config.toolbox.label) > 0
@@ -80,3 +79,37 @@ def test_factory_fixtures(get_toolbox, get_tool):
 
     with pytest.raises(FileNotFoundError):
         get_tool("nonexistent/tool")
+
+
+@pytest.mark.unit
+def test_discovery_index_cached(source_root, tools_root):
+    """Test the source tree is indexed once and tools are indexed by name."""
+    index = discover_all(source_root)
+
+    assert discover_all(source_root) is index
+    assert (
+        index.tool_by_name["buffer_analysis"] == tools_root / "spatial_analysis" / "buffer_analysis"
+    )
+    assert index.tool_by_name["load_tool_metadata"] == tools_root / "load_tool_metadata"
+
+
+@pytest.mark.unit
+def test_discovery_missing_directories(tmp_path):
+    """Test a source root without toolboxes/ or tools/ yields an empty index."""
+    index = discover_all(tmp_path)
+
+    assert index.toolboxes == ()
+    assert index.tools == ()
+    assert index.tool_by_name == {}
+
+
+@pytest.mark.unit
+def test_discovery_skips_private_dirs_and_nested_tools(tmp_path):
+    """Test toolset tools are found while _private dirs and tool subdirs are not."""
+    for tool_dir in ("standalone", "toolset/nested", "_private/hidden", "standalone/inner"):
+        (tmp_path / "tools" / tool_dir).mkdir(parents=True)
+        (tmp_path / "tools" / tool_dir / "tool.yml").touch()
+
+    index = discover_all(tmp_path)
+
+    assert [name for _, name in index.tools] == ["standalone", "nested"]
@@ -0,0 +1,289 @@
+"""Unit tests for the dynamic tool factory (no arcpy required)."""
+
+import logging
+
+import pytest
+
+from src.framework import config, factory
+from src.framework.factory import (
+    CONFIG_CACHE_FILENAME,
+    _GenericYAMLTool,
+    create_tool_class,
+    load_and_register_tools,
+    resolve_function,
+)
+
+TOOLBOX_YAML = """\
+toolbox:
+  label: Demo
+  alias: demo
+  description: Demo toolbox
+tools:
+  - name: demo_tool
+    config: ../../tools/demo_tool/tool.yml
+"""
+
+TOOL_YAML = """\
+tool:
+  name: demo_tool
+  label: Demo Tool
+  description: Demo
+implementation:
+  executeFunction: tests.test_factory.execute_noop
+parameters: []
+"""
+
+
+def execute_noop(parameters, messages, config):
+    """Execute function referenced by TOOL_YAML."""
+
+
+@pytest.fixture
+def demo_toolbox(tmp_path):
+    """Create a single-tool toolbox and return its config directory."""
+    config_dir = tmp_path / "toolboxes" / "demo"
+    config_dir.mkdir(parents=True)
+    (config_dir / "toolbox.yml").write_text(TOOLBOX_YAML)
+
+    tool_path = tmp_path / "tools" / "demo_tool" / "tool.yml"
+    tool_path.parent.mkdir(parents=True)
+    tool_path.write_text(TOOL_YAML)
+    return config_dir
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("config should have been served from the disk cache")
+
+
+@pytest.mark.unit
+def test_config_cache_written(demo_toolbox):
+    """Test a successful load pickles the parsed configs."""
+    toolbox_config, tool_classes = load_and_register_tools(demo_toolbox)
+
+    assert (demo_toolbox / CONFIG_CACHE_FILENAME).exists()
+    assert toolbox_config.toolbox.label == "Demo"
+    assert [cls.__name__ for cls in tool_classes] == ["DemoToolTool"]
+
+
+@pytest.mark.unit
+def test_config_cache_hit_skips_yaml(demo_toolbox, monkeypatch):
+    """Test an unchanged toolbox is loaded without parsing YAML."""
+    load_and_register_tools(demo_toolbox)
+
+    monkeypatch.setattr(factory, "load_toolbox_config", _fail)
+    monkeypatch.setattr(factory, "load_tool_config", _fail)
+    toolbox_config, tool_classes = load_and_register_tools(demo_toolbox)
+
+    assert toolbox_config.toolbox.alias == "demo"
+    assert len(tool_classes) == 1
+
+
+@pytest.mark.unit
+def test_config_cache_hit_primes_tool_config_memo(demo_toolbox, monkeypatch):
+    """Test configs from the disk cache are served by load_tool_config unvalidated."""
+    load_and_register_tools(demo_toolbox)
+    config.clear_config_cache()
+    load_and_register_tools(demo_toolbox)
+
+    monkeypatch.setattr(config, "load_yaml", _fail)
+    monkeypatch.setattr(config.ToolConfig, "__init__", _fail)
+    tool_config = config.load_tool_config(demo_toolbox / "../../tools/demo_tool/tool.yml")
+
+    assert tool_config.tool.label == "Demo Tool"
+
+
+@pytest.mark.unit
+def test_config_cache_invalidated_by_tool_edit(demo_toolbox, monkeypatch):
+    """Test editing a tool.yml forces the configs to be reparsed."""
+    load_and_register_tools(demo_toolbox)
+
+    tool_path = demo_toolbox.parent.parent / "tools" / "demo_tool" / "tool.yml"
+    tool_path.write_text(TOOL_YAML.replace("Demo Tool", "Edited Demo Tool"))
+
+    loaded = []
+    real_load_tool_config = factory.load_tool_config
+
+    def recording_load(path):
+        loaded.append(path)
+        return real_load_tool_config(path)
+
+    monkeypatch.setattr(factory, "load_tool_config", recording_load)
+    load_and_register_tools(demo_toolbox)
+
+    assert loaded == [demo_toolbox / "../../tools/demo_tool/tool.yml"]
+
+
+@pytest.mark.unit
+def test_corrupt_config_cache_ignored(demo_toolbox):
+    """Test an unreadable cache file falls back to parsing YAML."""
+    (demo_toolbox / CONFIG_CACHE_FILENAME).write_bytes(b"not a pickle")
+
+    toolbox_config, tool_classes = load_and_register_tools(demo_toolbox)
+
+    assert toolbox_config.toolbox.label == "Demo"
+    assert len(tool_classes) == 1
+
+
+@pytest.mark.unit
+def test_config_cache_invalidated_by_schema_change(demo_toolbox, monkeypatch):
+    """Test a cache written for different config models is not unpickled."""
+    load_and_register_tools(demo_toolbox)
+    version = factory._config_cache_version()
+
+    # The version follows the models' schemas
+    monkeypatch.setattr(
+        config.ToolConfig, "model_json_schema", classmethod(lambda cls: {"changed": True})
+    )
+    assert factory._config_cache_version.__wrapped__() != version
+
+    # A cache stamped with another version is a miss
+    monkeypatch.setattr(factory, "_config_cache_version", lambda: (1, "other", "schema"))
+    loaded = []
+    real_load_toolbox_config = factory.load_toolbox_config
+
+    def recording_load(config_dir):
+        loaded.append(config_dir)
+        return real_load_toolbox_config(config_dir)
+
+    monkeypatch.setattr(factory, "load_toolbox_config", recording_load)
+    load_and_register_tools(demo_toolbox)
+
+    assert loaded == [demo_toolbox]
+
+
+@pytest.fixture
+def demo_tool_path(demo_toolbox):
+    """Return the tool.yml path of the demo toolbox's only tool."""
+    return demo_toolbox.parent.parent / "tools" / "demo_tool" / "tool.yml"
+
+
+@pytest.mark.unit
+def test_create_tool_class_shares_implementation(demo_tool_path):
+    """Test generated classes only bind data onto the shared base class."""
+    tool_class = create_tool_class("demo_tool", demo_tool_path, execute_noop)
+
+    assert tool_class.__name__ == "DemoToolTool"
+    assert tool_class.__qualname__ == "DemoToolTool"
+    assert tool_class.__module__ == "src.framework.factory"
+    assert "Execute function: tests.test_factory.execute_noop" in tool_class.__doc__
+    assert tool_class.__bases__ == (_GenericYAMLTool,)
+    assert "execute" not in vars(tool_class)
+    assert "__init__" not in vars(tool_class)
+
+
+@pytest.mark.unit
+def test_generated_tool_executes_bound_function(demo_tool_path, mock_messages):
+    """Test instances load their config and delegate to the execute function."""
+    calls = []
+
+    def execute(parameters, messages, config):
+        calls.append((parameters, messages, config))
+
+    tool = create_tool_class("demo_tool", demo_tool_path, execute)()
+    tool.execute(["param"], mock_messages)
+
+    assert tool.label == "Demo Tool"
+    assert calls == [(["param"], mock_messages, tool.config)]
+
+
+@pytest.mark.unit
+def test_generated_tool_reports_execute_errors(demo_tool_path, mock_messages):
+    """Test execute failures are reported with tool context and re-raised."""
+
+    def execute(parameters, messages, config):
+        raise RuntimeError("boom")
+
+    tool = create_tool_class("demo_tool", demo_tool_path, execute)()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        tool.execute([], mock_messages)
+
+    mock_messages.addErrorMessage.assert_called_once_with(
+        "Error in Demo Tool (config: tool.yml): boom"
+    )
+
+
+@pytest.mark.unit
+def test_resolve_function_cached(monkeypatch):
+    """Test execute functions are imported once per dotted path."""
+    assert resolve_function("tests.test_factory.execute_noop") is execute_noop
+
+    monkeypatch.setattr(factory.importlib, "import_module", _fail)
+    assert resolve_function("tests.test_factory.execute_noop") is execute_noop
+
+
+@pytest.mark.unit
+def test_registration_logged(demo_toolbox, caplog):
+    """Test registration progress is reported through the module logger."""
+    with caplog.at_level("INFO", logger="src.framework.factory"):
+        load_and_register_tools(demo_toolbox)
+
+    assert "  ✓ Registered: DemoToolTool -> Demo Tool" in caplog.messages
+    assert caplog.messages[-1] == "Successfully loaded 1 tool classes"
+
+    # The library leaves output handling to the host
+    assert [type(h) for h in factory.logger.handlers] == [logging.NullHandler]
+
+
+@pytest.mark.unit
+def test_disabled_tools_skipped(demo_toolbox):
+    """Test disabled tools stay listed but their configs are never touched."""
+    (demo_toolbox / "toolbox.yml").write_text(
+        TOOLBOX_YAML
+        + "  - name: retired_tool\n"
+        + "    enabled: false\n"
+        + "    config: ../../tools/retired_tool/tool.yml\n"
+    )
+
+    toolbox_config, tool_classes = load_and_register_tools(demo_toolbox)
+
+    assert [t.name for t in toolbox_config.tools] == ["demo_tool", "retired_tool"]
+    assert [t.name for t in toolbox_config.enabled_tools] == ["demo_tool"]
+    assert len(tool_classes) == 1
+
+
+@pytest.mark.unit
+def test_generated_tool_uses_slots(demo_tool_path):
+    """Test generated tool instances store attributes in slots, not a __dict__."""
+    tool = create_tool_class("demo_tool", demo_tool_path, execute_noop)()
+
+    assert not hasattr(tool, "__dict__")
+    assert tool._config_path == demo_tool_path
+
+
+@pytest.mark.unit
+def test_tools_registered_in_toolbox_order(tmp_path):
+    """Test tools keep toolbox.yml order and a failing tool does not stop the rest."""
+    config_dir = tmp_path / "toolboxes" / "demo"
+    config_dir.mkdir(parents=True)
+    names = [f"tool_{i}" for i in range(12)]
+    (config_dir / "toolbox.yml").write_text(
+        TOOLBOX_YAML.split("tools:")[0]
+        + "tools:\n"
+        + "".join(f"  - name: {name}\n    config: ../../tools/{name}/tool.yml\n" for name in names)
+    )
+    for name in names:
+        tool_path = tmp_path / "tools" / name / "tool.yml"
+        tool_path.parent.mkdir(parents=True)
+        tool_yaml = TOOL_YAML.replace("demo_tool", name)
+        if name == "tool_5":
+            tool_yaml = tool_yaml.replace("execute_noop", "missing_function")
+        tool_path.write_text(tool_yaml)
+
+    _, tool_classes = load_and_register_tools(config_dir)
+
+    assert [cls._bound[0] for cls in tool_classes] == [n for n in names if n != "tool_5"]
+    assert not (config_dir / CONFIG_CACHE_FILENAME).exists()
+
+
+@pytest.mark.unit
+def test_supplied_toolbox_config_reused(demo_toolbox, monkeypatch):
+    """Test a caller-supplied toolbox config is used without reading toolbox.yml."""
+    toolbox_config = config.load_toolbox_config(demo_toolbox)
+    monkeypatch.setattr(factory, "load_toolbox_config", _fail)
+
+    returned, tool_classes = load_and_register_tools(demo_toolbox, toolbox_config)
+
+    assert returned is toolbox_config
+    assert len(tool_classes) == 1
+    assert not (demo_toolbox / CONFIG_CACHE_FILENAME).exists()
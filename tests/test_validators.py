@@ -0,0 +1,169 @@
+"""Unit tests for runtime parameter validation."""
+
+import pickle
+import re
+import types
+
+import pytest
+
+from src.framework import config
+from src.framework.config import ParameterConfig, ValidationCheck, load_tool_config
+from src.framework.validators import (
+    ValidationError,
+    _run_check,
+    get_parameter_validator,
+    validate_all_parameters,
+)
+
+
+@pytest.mark.unit
+def test_regex_check():
+    """Test regex checks match from the start of string values."""
+    check = ValidationCheck(type="regex", pattern=r"[A-Z]{2}\d+", message="Bad code")
+
+    _run_check("code", "AB123", check)
+
+    for value in ("ab123", "xAB123", 123, None):
+        with pytest.raises(ValidationError, match="Bad code"):
+            _run_check("code", value, check)
+
+
+@pytest.mark.unit
+def test_regex_pattern_compiled_once():
+    """Test the compiled pattern is cached on the check."""
+    check = ValidationCheck(type="regex", pattern=r"\d+")
+
+    assert check.compiled_pattern is check.compiled_pattern
+    assert ValidationCheck(type="regex").compiled_pattern is None
+
+
+@pytest.mark.unit
+def test_regex_prefers_re2_with_fallback(monkeypatch):
+    """Test re2 compiles supported patterns and re handles the rest."""
+
+    class FakeRE2Error(Exception):
+        pass
+
+    def fake_compile(pattern):
+        if "(?=" in pattern:
+            raise FakeRE2Error("lookaround not supported")
+        return ("re2", pattern)
+
+    monkeypatch.setattr(
+        config, "re2", types.SimpleNamespace(compile=fake_compile, error=FakeRE2Error)
+    )
+
+    assert ValidationCheck(type="regex", pattern=r"\d+").compiled_pattern == ("re2", r"\d+")
+    fallback = ValidationCheck(type="regex", pattern=r"(?=\d)\w+").compiled_pattern
+    assert isinstance(fallback, re.Pattern)
+
+
+@pytest.mark.unit
+def test_compiled_pattern_not_pickled():
+    """Test pickled checks drop the compiled pattern and rebuild it on demand."""
+    check = ValidationCheck(type="regex", pattern=r"\d+")
+    assert check.compiled_pattern.match("42")
+
+    restored = pickle.loads(pickle.dumps(check))
+
+    assert "compiled_pattern" not in vars(restored)
+    assert restored.compiled_pattern.match("42")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("check", "valid", "invalid"),
+    [
+        (ValidationCheck(type="greater_than", value=0), [1, 0.5], [0, -1, None]),
+        (ValidationCheck(type="less_than", value=10), [9, -1], [10, 11, None]),
+        (ValidationCheck(type="min_value", value=0), [0, 5], [-1, None]),
+        (ValidationCheck(type="max_value", value=10), [10, 0], [11, None]),
+        (
+            ValidationCheck(type="one_of", values=["a", "b", 1]),
+            ["a", "b", 1, 1.0],
+            ["c", None, ["a"]],
+        ),
+        (ValidationCheck(type="not_empty"), ["x", " x ", [1]], ["", "   ", "\t\n", None, []]),
+    ],
+    ids=lambda p: p.type if isinstance(p, ValidationCheck) else None,
+)
+def test_check_types(check, valid, invalid):
+    """Test each check type accepts valid values and rejects invalid ones."""
+    for value in valid:
+        _run_check("param", value, check)
+
+    for value in invalid:
+        with pytest.raises(ValidationError, match="Validation failed for param"):
+            _run_check("param", value, check)
+
+
+@pytest.mark.unit
+def test_one_of_values_set_cached():
+    """Test one_of values are turned into a set once per check."""
+    check = ValidationCheck(type="one_of", values=["a", "b"])
+
+    assert check.value_set == {"a", "b"}
+    assert check.value_set is check.value_set
+    assert ValidationCheck(type="one_of").value_set == frozenset()
+
+
+def _param(**kwargs) -> ParameterConfig:
+    return ParameterConfig(
+        displayName="Distance",
+        datatype="GPDouble",
+        parameterType="Required",
+        direction="Input",
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+def test_parameter_validator_composed_once():
+    """Test a parameter's checks are composed into one cached validator."""
+    param = _param(
+        name="distance",
+        index=0,
+        validation=[
+            ValidationCheck(type="greater_than", value=0),
+            ValidationCheck(type="less_than", value=10, message="Too far"),
+        ],
+    )
+    validator = get_parameter_validator(param)
+
+    assert get_parameter_validator(param) is validator
+    validator(5)
+    with pytest.raises(ValidationError, match="Validation failed for distance"):
+        validator(0)
+    with pytest.raises(ValidationError, match="Too far"):
+        validator(10)
+
+    # The cached closure is not pickled with the config
+    restored = pickle.loads(pickle.dumps(param))
+    assert restored._validator is None
+
+
+@pytest.mark.unit
+def test_validate_all_parameters(mock_parameters, get_tool):
+    """Test all parameters with rules are validated by index."""
+    buffer_config = load_tool_config(get_tool("spatial_analysis/buffer_analysis") / "tool.yml")
+    validate_all_parameters(mock_parameters, buffer_config)
+
+    mock_parameters[1].value = -1
+    with pytest.raises(ValidationError, match="must be > 0"):
+        validate_all_parameters(mock_parameters, buffer_config)
+
+
+@pytest.mark.unit
+def test_validate_all_parameters_collects_errors(mock_parameters, get_tool):
+    """Test collect_errors reports every failing parameter in one error."""
+    buffer_config = load_tool_config(get_tool("spatial_analysis/buffer_analysis") / "tool.yml")
+    mock_parameters[1].value = -1
+    mock_parameters[2].value = "furlongs"
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate_all_parameters(mock_parameters, buffer_config, collect_errors=True)
+
+    lines = str(excinfo.value).splitlines()
+    assert len(lines) == 2
+    assert "must be > 0" in lines[0]
+    assert "Invalid unit of measurement" in lines[1]
@@ -3,6 +3,7 @@
 import pytest
 
 from src.framework.config import load_tool_config, load_toolbox_config
+from src.framework.yaml_loader import load_yaml
 
 
 @pytest.mark.unit
@@ -29,6 +30,19 @@ def test_load_buffer_tool_config(get_tool):
     assert len(config.parameters) == 5
 
 
+@pytest.mark.unit
+def test_tool_config_parameter_lookups(get_tool):
+    """Test cached name and index lookups over tool parameters."""
+    config = load_tool_config(get_tool("spatial_analysis/buffer_analysis") / "tool.yml")
+
+    assert config.parameters_by_name["buffer_units"].index == 2
+    assert [p.index for p in config.parameters_by_index] == [0, 1, 2, 3, 4]
+    assert config.parameters_by_name is config.parameters_by_name
+    assert config.idx("dissolve_output") == 3
+    assert config.param_index is config.param_index
+    assert [p.name for p in config.validated_parameters] == ["buffer_distance", "buffer_units"]
+
+
 @pytest.mark.unit
 def test_load_clip_tool_config(get_tool):
     """Test loading clip tool configuration."""
@@ -48,3 +62,58 @@ def test_parameter_index_validation(get_tool):
     expected_indices = list(range(len(config.parameters)))
 
     assert indices == expected_indices
+
+
+@pytest.mark.unit
+def test_load_yaml_accepts_text_and_bytes():
+    """Test the shared YAML loader parses text and binary input alike."""
+    document = "tool:\n  name: demo\n  tags: [a, b]\n"
+
+    assert load_yaml(document) == load_yaml(document.encode("utf-8"))
+    assert load_yaml(document) == {"tool": {"name": "demo", "tags": ["a", "b"]}}
+
+
+MINIMAL_TOOL_YAML = """\
+tool:
+  name: demo_tool
+  label: Demo Tool
+  description: Demo
+implementation:
+  executeFunction: demo.execute
+parameters: []
+"""
+
+
+@pytest.mark.unit
+def test_load_tool_config_is_memoized(tmp_path):
+    """Test repeated loads of an unchanged file return the cached config."""
+    config_path = tmp_path / "demo_tool" / "tool.yml"
+    config_path.parent.mkdir()
+    config_path.write_text(MINIMAL_TOOL_YAML)
+
+    first = load_tool_config(config_path)
+    assert load_tool_config(config_path) is first
+
+    # Editing the file invalidates the cached entry
+    config_path.write_text(MINIMAL_TOOL_YAML.replace("Demo Tool", "Edited Demo Tool"))
+    reloaded = load_tool_config(config_path)
+    assert reloaded is not first
+    assert reloaded.tool.label == "Edited Demo Tool"
+
+
+@pytest.mark.unit
+def test_load_toolbox_config_is_memoized(get_toolbox):
+    """Test repeated loads of an unchanged toolbox.yml return the cached config."""
+    toolbox_dir = get_toolbox("spatial_analysis")
+
+    assert load_toolbox_config(toolbox_dir) is load_toolbox_config(toolbox_dir)
+
+
+@pytest.mark.unit
+def test_load_tool_config_reads_utf8(tmp_path):
+    """Test tool configs are decoded as UTF-8 regardless of the locale."""
+    config_path = tmp_path / "demo_tool" / "tool.yml"
+    config_path.parent.mkdir()
+    config_path.write_bytes(MINIMAL_TOOL_YAML.replace("Demo Tool", "Démo Tool").encode("utf-8"))
+
+    assert load_tool_config(config_path).tool.label == "Démo Tool"
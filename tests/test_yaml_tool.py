@@ -0,0 +1,78 @@
+"""Unit tests for building arcpy parameters from YAML (uses the arcpy stub)."""
+
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from src.framework.yaml_tool import YAMLTool
+
+
+@pytest.fixture
+def buffer_tool(get_tool):
+    """Create a YAMLTool for the example buffer tool."""
+    config_path = get_tool("spatial_analysis/buffer_analysis") / "tool.yml"
+    return YAMLTool("buffer_analysis", config_path)
+
+
+@pytest.mark.unit
+def test_buffer_tool_parameters(buffer_tool):
+    """Test parameters are built in index order with defaults and filters."""
+    params = buffer_tool.getParameterInfo()
+
+    assert [p.name for p in params] == [
+        "input_features",
+        "buffer_distance",
+        "buffer_units",
+        "dissolve_output",
+        "output_features",
+    ]
+    assert params[1].value == 100
+    assert params[1].filter.type == "Range"
+    assert params[1].filter.list == [0, 10000]
+    assert params[2].filter.type == "ValueList"
+    assert params[2].filter.list == ["meters", "feet", "kilometers", "miles"]
+    assert params[4].direction == "Output"
+
+
+@pytest.mark.unit
+def test_parameter_recipes_computed_once(buffer_tool):
+    """Test parameter recipes are cached on the config and parameters stay fresh."""
+    recipes = buffer_tool.config.parameter_recipes
+
+    assert buffer_tool.config.parameter_recipes is recipes
+    assert buffer_tool.getParameterInfo()[0] is not buffer_tool.getParameterInfo()[0]
+
+
+@pytest.mark.unit
+def test_parameters_use_arcpy_from_sys_modules(buffer_tool, monkeypatch):
+    """Test patching sys.modules alone swaps the arcpy used by getParameterInfo."""
+    created = []
+
+    def fake_parameter(**kwargs):
+        created.append(kwargs["name"])
+        return types.SimpleNamespace(filter=types.SimpleNamespace(), **kwargs)
+
+    monkeypatch.setitem(sys.modules, "arcpy", types.SimpleNamespace(Parameter=fake_parameter))
+    buffer_tool.getParameterInfo()
+
+    assert created[0] == "input_features"
+    assert len(created) == 5
+
+
+@pytest.mark.unit
+def test_framework_import_does_not_load_arcpy():
+    """Test importing the framework leaves arcpy unimported until needed."""
+    code = "import sys, src.framework.factory; sys.exit('arcpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent)
+
+    assert result.returncode == 0
+
+
+@pytest.mark.unit
+def test_unknown_tool_raises_file_not_found():
+    """Test a tool without a discoverable or legacy config fails to load."""
+    with pytest.raises(FileNotFoundError, match="nonexistent_tool.yml"):
+        YAMLTool("nonexistent_tool")
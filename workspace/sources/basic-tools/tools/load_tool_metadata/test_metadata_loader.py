@@ -5,6 +5,11 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.framework.config import load_tool_config, load_toolbox_config
+from src.framework.factory import create_tool_class
+
+from .execute import execute_metadata_loader
+
 
 @pytest.fixture
 def mock_arcpy(monkeypatch):
@@ -20,10 +25,6 @@ def mock_arcpy(monkeypatch):
 
 def test_metadata_loader_tool_creation():
     """Test that metadata loader tool can be created from YAML config."""
-    from src.framework.factory import create_tool_class
-
-    from .execute import execute_metadata_loader
-
     config_path = Path(__file__).parent / "tool.yml"
     assert config_path.exists(), f"Config not found: {config_path}"
 
@@ -52,8 +53,6 @@ def test_metadata_loader_tool_creation():
 
 def test_metadata_loader_in_toolbox():
     """Test that metadata loader tool is registered in the toolbox."""
-    from src.framework.config import load_toolbox_config
-
     # Get utilities toolbox path relative to this test file
     # From: src/tools/load_tool_metadata/test_metadata_loader.py
     # To:   src/toolboxes/utilities/
@@ -72,8 +71,6 @@ def test_metadata_loader_in_toolbox():
 
 def test_metadata_loader_has_documentation():
     """Test that metadata loader tool has proper documentation."""
-    from src.framework.config import load_tool_config
-
     config_path = Path(__file__).parent / "tool.yml"
     tool_config = load_tool_config(config_path)
 
@@ -11,6 +11,7 @@ from src.framework.config import (
     ToolMetadata,
     ValidationCheck,
 )
+from src.framework.validators import ValidationError
 
 from .execute import execute_buffer
 
@@ -120,8 +121,6 @@ def test_buffer_execution(mock_buffer_config, mock_parameters):
 
 def test_buffer_with_invalid_distance(mock_buffer_config, mock_parameters):
     """Test buffer with invalid distance."""
-    from src.framework.validators import ValidationError
-
     mock_parameters[1].value = -100.0  # Invalid negative
     messages = Mock()
 
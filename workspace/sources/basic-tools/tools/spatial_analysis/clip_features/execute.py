@@ -21,13 +21,10 @@ def execute_clip(parameters, messages, config: ToolConfig):
         config: Tool configuration from YAML
     """
     try:
-        # Build parameter index map from config
-        param_map = {p.name: p.index for p in config.parameters}
-
         # Extract parameters using index from YAML
-        input_features = parameters[param_map["input_features"]].valueAsText
-        clip_features = parameters[param_map["clip_features"]].valueAsText
-        output_features = parameters[param_map["output_features"]].valueAsText
+        input_features = parameters[config.idx("input_features")].valueAsText
+        clip_features = parameters[config.idx("clip_features")].valueAsText
+        output_features = parameters[config.idx("output_features")].valueAsText
 
         # Validate parameters against YAML rules
         validate_all_parameters(parameters, config, messages)
@@ -42,9 +39,10 @@ def execute_clip(parameters, messages, config: ToolConfig):
         check_spatial_reference(input_features, messages)
         check_spatial_reference(clip_features, messages)
 
-        # Get input counts
-        input_count = get_feature_count(input_features)
-        messages.addMessage(f"Input features: {input_count:,}")
+        # Counting the input is a full scan, so it is opt-in
+        if config.implementation.options.get("report_input_count", False):
+            input_count = get_feature_count(input_features)
+            messages.addMessage(f"Input features: {input_count:,}")
 
         messages.addMessage("Clipping features...")
 